@@ -2,7 +2,8 @@
 # detect spending anomalies, large purchases, patterns
 
 from models.transaction import Transaction
-from statistics import mean, stdev
+from functools import cached_property
+import numpy as np
 import config
 
 class AnomalyDetector:
@@ -14,6 +15,15 @@ class AnomalyDetector:
             if t.is_expense and t.amount > 0
         ]
 
+    @cached_property
+    def _amounts(self) -> np.ndarray:
+        """expense amounts as one float array, built once and shared by the scans"""
+        return np.fromiter(
+            (t.amount for t in self.transactions),
+            dtype=np.float64,
+            count=len(self.transactions),
+        )
+
     def large_purchases(self, percentile: float = 90) -> list[dict]:
         """
         find unusually large purchases.
@@ -22,27 +32,27 @@ class AnomalyDetector:
         if not self.transactions:
             return []
 
-        amounts = [t.amount for t in self.transactions]
-        amounts_sorted = sorted(amounts)
-        idx = int(len(amounts_sorted) * (percentile / 100))
-        threshold = amounts_sorted[idx]
+        amounts = self._amounts
+        idx = int(len(amounts) * (percentile / 100))
+        # only the threshold's rank matters, so a partial sort is enough
+        threshold = np.partition(amounts, idx)[idx]
 
-        large = []
-        for txn in self.transactions:
-            if txn.amount >= threshold:
-                large.append({
-                    "date": txn.date,
-                    "merchant": txn.merchant,
-                    "amount": txn.amount,
-                    "category": txn.category,
-                    "description": txn.description,
-                })
+        # filter and rank on the array; dicts are built only for the hits
+        hits = np.flatnonzero(amounts >= threshold)
+        hits = hits[np.argsort(-amounts[hits], kind='stable')]
 
-        return sorted(
-            large,
-            key=lambda x: x["amount"],
-            reverse=True
-        )
+        large = []
+        for i in hits.tolist():
+            txn = self.transactions[i]
+            large.append({
+                "date": txn.date,
+                "merchant": txn.merchant,
+                "amount": txn.amount,
+                "category": txn.category,
+                "description": txn.description,
+            })
+
+        return large
 
     def statistical_outliers(self, std_dev_threshold: float = 2.0) -> list[dict]:
         """
@@ -52,31 +62,30 @@ class AnomalyDetector:
         if len(self.transactions) < 2:
             return []
 
-        amounts = [t.amount for t in self.transactions]
-        avg = mean(amounts)
-        std = stdev(amounts)
+        amounts = self._amounts
+        avg = amounts.mean()
+        std = amounts.std(ddof=1)  # sample stdev, as statistics.stdev
 
         if std == 0:
             return []
 
-        outliers = []
-        for txn in self.transactions:
-            z_score = abs((txn.amount - avg) / std)
-            if z_score >= std_dev_threshold:
-                outliers.append({
-                    "date": txn.date,
-                    "merchant": txn.merchant,
-                    "amount": txn.amount,
-                    "category": txn.category,
-                    "z_score": z_score,
-                    "description": txn.description,
-                })
+        z_scores = np.abs((amounts - avg) / std)
+        hits = np.flatnonzero(z_scores >= std_dev_threshold)
+        hits = hits[np.argsort(-z_scores[hits], kind='stable')]
 
-        return sorted(
-            outliers,
-            key=lambda x: x["z_score"],
-            reverse=True
-        )
+        outliers = []
+        for i in hits.tolist():
+            txn = self.transactions[i]
+            outliers.append({
+                "date": txn.date,
+                "merchant": txn.merchant,
+                "amount": txn.amount,
+                "category": txn.category,
+                "z_score": float(z_scores[i]),
+                "description": txn.description,
+            })
+
+        return outliers
 
     def unusual_categories(self) -> dict[str, dict]:
         """
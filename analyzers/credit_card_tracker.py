@@ -6,6 +6,7 @@ from pathlib import Path
 from datetime import datetime
 from models.credit_card_charge import CreditCardCharge, ChargeStatus
 from models.transaction import Transaction
+from analyzers.json_cache import mtime_cached
 
 
 class CreditCardTracker:
@@ -13,20 +14,22 @@ class CreditCardTracker:
 
     def __init__(self, config_path: str = "data/credit_card_charges.json"):
         self.config_path = Path(config_path)
-        self.charges = []
-        self._load_charges()
+        loaded = self._load_charges()
+        if loaded is not None:
+            print(f"✅ loaded {len(loaded)} credit card charges")
+        self.charges = loaded or []
 
+    @mtime_cached(CreditCardCharge)
     def _load_charges(self):
-        """load tracked charges from file"""
+        """load tracked charges from fil (None if missing or unreadable)"""
         if not self.config_path.exists():
-            self.charges = []
-            return
+            return None
 
         try:
-            with open(self.config_path, "r") as f:
+            with open(self.config_path, "r", encoding="utf-8") as f:
                 data = json.load(f)
 
-            self.charges = [
+            return [
                 CreditCardCharge(
                     date=datetime.fromisoformat(charge["date"]),
                     merchant=charge["merchant"],
@@ -45,10 +48,9 @@ class CreditCardTracker:
                 )
                 for charge in data
             ]
-            print(f"✅ loaded {len(self.charges)} credit card charges")
         except Exception as e:
             print(f"⚠️  error loading charges: {e}")
-            self.charges = []
+            return None
 
     def _save_charges(self):
         """save charges to file"""
@@ -5,26 +5,29 @@ import json
 from pathlib import Path
 from datetime import datetime
 from models.inventory_item import InventoryItem, ItemStatus
+from analyzers.json_cache import mtime_cached
 
 class InventoryManager:
     """manage inventory items with expiration dates"""
 
     def __init__(self, config_path: str = "data/inventory.json"):
         self.config_path = Path(config_path)
-        self.items = []
-        self._load_inventory()
+        loaded = self._load_inventory()
+        if loaded is not None:
+            print(f"✅ loaded {len(loaded)} inventory items")
+        self.items = loaded or []
 
+    @mtime_cached(InventoryItem)
     def _load_inventory(self):
-        """load inventory from file"""
+        """load inventory from fil (None if missing or unreadable)"""
         if not self.config_path.exists():
-            self.items = []
-            return
+            return None
 
         try:
-            with open(self.config_path, 'r') as f:
+            with open(self.config_path, 'r', encoding='utf-8') as f:
                 data = json.load(f)
 
-            self.items = [
+            return [
                 InventoryItem(
                     name=item['name'],
                     category=item['category'],
@@ -38,10 +41,9 @@ class InventoryManager:
                 )
                 for item in data
             ]
-            print(f"✅ loaded {len(self.items)} inventory items")
         except Exception as e:
             print(f"⚠️  error loading inventory: {e}")
-            self.items = []
+            return None
 
     def _save_inventory(self):
         """save inventory to file"""
@@ -0,0 +1,76 @@
+# analyzers/json_cache.py
+# pickle sidecar caches for the json-backed managers and parsed csv exports
+
+import os
+import pickle
+from functools import wraps
+from pathlib import Path
+
+
+def model_version(model: type) -> tuple:
+    """
+    the model's field names, as part of a cache signature. pickles restore
+    objects without running __init__, so a cache written before a field was
+    added or renamed must not be reused.
+    """
+    return (model.__qualname__, tuple(model.__dataclass_fields__))
+
+
+def read_sidecar(path: Path, signature: tuple):
+    """the payload pickled after `signature`, or None if it doesn't match"""
+    try:
+        with open(path, "rb") as f:
+            if pickle.load(f) == signature:
+                return pickle.load(f)
+    except Exception:
+        # missing, stale-format or corrupt cache: caller rebuilds it
+        pass
+    return None
+
+
+def write_sidecar(path: Path, signature: tuple, payload):
+    """pickle `signature` then `payload`; a cache that can't be written is skipped"""
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "wb") as f:
+            pickle.dump(signature, f, protocol=pickle.HIGHEST_PROTOCOL)
+            pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
+    except OSError:
+        pass
+
+
+def mtime_cached(model: type):
+    """
+    cache a manager's parsed json data in a pickle sidecar.
+
+    wraps a `_load_*` method that reads `self.config_path` and returns a
+    list of `model` objects (or None when there is nothing to load). the
+    sidecar (`<name>.cache.pkl`) stores the json file's mtime + size and
+    the model's fields next to the parsed objects; while they still match,
+    the pickled objects (datetimes, enums intact) are returned instead of
+    re-parsing the json. any save rewrites the json, which invalidates it.
+    """
+    def decorator(load):
+        @wraps(load)
+        def wrapper(self):
+            json_path = Path(self.config_path)
+            try:
+                st = os.stat(json_path)
+            except OSError:
+                return load(self)
+
+            cache_path = json_path.with_suffix(".cache.pkl")
+            signature = (st.st_mtime_ns, st.st_size, model_version(model))
+
+            data = read_sidecar(cache_path, signature)
+            if data is not None:
+                return data
+
+            data = load(self)
+            # don't cache empty results, so a broken json file keeps warning
+            if data:
+                write_sidecar(cache_path, signature, data)
+            return data
+
+        return wrapper
+    return decorator
@@ -0,0 +1,22 @@
+# analyzers/query_cache.py
+# memoized list queries for the json-backed managers
+
+
+class QueryCacheMixin:
+    """
+    memoize a manager's derived lists (e.g. pending wants) until its data
+    changes. the manager sets `self._query_cache = {}` in __init__ and calls
+    invalidate_cache() from its save method, which every mutation goes through.
+    """
+
+    def _cached(self, key: str, build):
+        """the memoized result of build(); shared, so callers must not mutate it"""
+        try:
+            return self._query_cache[key]
+        except KeyError:
+            result = self._query_cache[key] = build()
+            return result
+
+    def invalidate_cache(self):
+        """drop memoized queries (every save does this)"""
+        self._query_cache.clear()
@@ -5,26 +5,29 @@ import json
 from pathlib import Path
 from datetime import datetime, timedelta
 from models.recurring_purchase import RecurringPurchase, PurchaseFrequency
+from analyzers.json_cache import mtime_cached
 
 class RecurringPurchasesManager:
     """manage recurring purchases (not subscriptions)"""
 
     def __init__(self, config_path: str = "data/recurring_purchases.json"):
         self.config_path = Path(config_path)
-        self.purchases = []
-        self._load_purchases()
+        loaded = self._load_purchases()
+        if loaded is not None:
+            print(f"✅ loaded {len(loaded)} recurring purchases")
+        self.purchases = loaded or []
 
+    @mtime_cached(RecurringPurchase)
     def _load_purchases(self):
-        """load purchases from file"""
+        """load purchases from fil (None if missing or unreadable)"""
         if not self.config_path.exists():
-            self.purchases = []
-            return
+            return None
 
         try:
-            with open(self.config_path, 'r') as f:
+            with open(self.config_path, 'r', encoding='utf-8') as f:
                 data = json.load(f)
 
-            self.purchases = [
+            return [
                 RecurringPurchase(
                     name=purchase['name'],
                     merchant=purchase['merchant'],
@@ -43,10 +46,9 @@ class RecurringPurchasesManager:
                 )
                 for purchase in data
             ]
-            print(f"✅ loaded {len(self.purchases)} recurring purchases")
         except Exception as e:
             print(f"⚠️  error loading purchases: {e}")
-            self.purchases = []
+            return None
 
     def _save_purchases(self):
         """save purchases to file"""
@@ -4,26 +4,30 @@ import json
 from pathlib import Path
 from datetime import datetime
 from models.sinking_fund import SinkingFund
+from analyzers.json_cache import mtime_cached
 
 class SinkingFundManager:
     """Manages all sinking fund savings goals."""
 
     def __init__(self, config_path: str = "data/sinking_funds.json"):
         self.config_path = Path(config_path)
-        self.funds = []
-        self._load_funds()
+        loaded = self._load_funds()
+        if loaded is not None:
+            print(f"✅ Loaded {len(loaded)} sinking funds.")
+        self.funds = loaded or []
 
+    @mtime_cached(SinkingFund)
     def _load_funds(self):
-        """Loads sinking funds from a JSON file."""
+        """Loads sinking funds from a JSON file. Returns None if missing or unreadable."""
         if not self.config_path.exists():
-            return
+            return None
         try:
-            with open(self.config_path, 'r') as f:
+            with open(self.config_path, 'r', encoding='utf-8') as f:
                 data = json.load(f)
-            self.funds = [SinkingFund(**fund_data) for fund_data in data]
-            print(f"✅ Loaded {len(self.funds)} sinking funds.")
+            return [SinkingFund(**fund_data) for fund_data in data]
         except Exception as e:
             print(f"⚠️ Error loading sinking funds: {e}")
+            return None
 
     def _save_funds(self):
         """Saves sinking funds to a JSON file."""
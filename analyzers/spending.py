@@ -3,6 +3,9 @@
 
 from models.transaction import Transaction
 from datetime import datetime, timedelta
+from functools import cached_property
+import numpy as np
+import pandas as pd
 import config
 
 class SpendingAnalyzer:
@@ -15,24 +18,67 @@ class SpendingAnalyzer:
             if t.is_expense and t.amount > 0
         ]
 
+    # everything below only depends on self.expenses, which is fixed at
+    # construction, so the aggregates are computed once and shared
+
+    @cached_property
+    def _core_stats(self) -> dict:
+        """
+        one pass over the expenses into parallel numpy columns, then every
+        aggregate is a bincount over integer codes instead of a python loop.
+        """
+        expenses = self.expenses
+        n = len(expenses)
+        amounts = np.fromiter((t.amount for t in expenses), dtype=np.float64, count=n)
+        dates_ns = np.fromiter((t.date_ns for t in expenses), dtype=np.int64, count=n)
+        cat_codes, cat_labels = pd.factorize(np.array([t.category for t in expenses], dtype=object))
+        merch_codes, merch_labels = pd.factorize(np.array([t.merchant for t in expenses], dtype=object))
+
+        def ranked(codes, labels) -> list[tuple]:
+            # highest total first; stable, so ties keep first-seen order
+            totals = np.bincount(codes, weights=amounts, minlength=len(labels))
+            order = np.argsort(-totals, kind='stable')
+            return list(zip(labels[order].tolist(), totals[order].tolist()))
+
+        # np.unique sorts, which is exactly the 'YYYY-MM' key order
+        month_labels, month_codes = np.unique(
+            dates_ns.astype('datetime64[ns]').astype('datetime64[M]'), return_inverse=True
+        )
+        month_totals = np.bincount(month_codes, weights=amounts, minlength=len(month_labels))
+        by_month = dict(zip(month_labels.astype(str).tolist(), month_totals.tolist()))
+
+        return {
+            "total_spent": float(amounts.sum()) if n else 0,
+            "by_category": dict(ranked(cat_codes, cat_labels)),
+            "by_month": by_month,
+            "top_merchants": ranked(merch_codes, merch_labels),
+            "average_monthly": float(month_totals.mean()) if len(month_totals) else 0,
+            "date_range": self.get_date_range(),
+        }
+
+    def compute_core_stats(self) -> dict:
+        """
+        all the headline aggregates in one call:
+        total_spent, by_category, by_month, top_merchants, average_monthly, date_range
+        """
+        # hand out copies so callers can't mutate the cached aggregates
+        stats = dict(self._core_stats)
+        stats["by_category"] = dict(stats["by_category"])
+        stats["by_month"] = dict(stats["by_month"])
+        stats["top_merchants"] = list(stats["top_merchants"])
+        return stats
+
     def total_spent(self) -> float:
         """total spending (all time)"""
-        return sum(t.amount for t in self.expenses)
+        return self._core_stats["total_spent"]
 
     def by_category(self) -> dict[str, float]:
         """spending breakdown by category"""
-        result = {}
-        for txn in self.expenses:
-            result[txn.category] = result.get(txn.category, 0) + txn.amount
-        return dict(sorted(result.items(), key=lambda x: x[1], reverse=True))
+        return dict(self._core_stats["by_category"])
 
     def by_month(self) -> dict[str, float]:
         """spending by month"""
-        result = {}
-        for txn in self.expenses:
-            month_key = txn.date.strftime('%Y-%m')
-            result[month_key] = result.get(month_key, 0) + txn.amount
-        return dict(sorted(result.items()))
+        return dict(self._core_stats["by_month"])
 
     def category_by_month(self) -> dict[str, dict[str, float]]:
         """spending by category per month (for tracking trends)"""
@@ -47,28 +93,17 @@ class SpendingAnalyzer:
 
     def average_monthly(self) -> float:
         """average monthly spend"""
-        by_month = self.by_month()
-        if not by_month:
-            return 0
-        return sum(by_month.values()) / len(by_month)
+        return self._core_stats["average_monthly"]
 
     def top_merchants(self, limit: int = 10) -> list[tuple]:
         """top spending by merchant"""
-        merchant_totals = {}
-        for txn in self.expenses:
-            merchant_totals[txn.merchant] = (
-                merchant_totals.get(txn.merchant, 0) + txn.amount
-            )
-        sorted_merchants = sorted(
-            merchant_totals.items(),
-            key=lambda x: x[1],
-            reverse=True
-        )
-        return sorted_merchants[:limit]
+        return self._core_stats["top_merchants"][:limit]
 
     def get_date_range(self) -> tuple[datetime, datetime]:
         """get min and max date from transactions"""
         if not self.transactions:
             return None, None
-        dates = [t.date for t in self.transactions]
-        return min(dates), max(dates)
\ No newline at end of file
+        # compare the integer dates, only touch datetimes for the result
+        first = min(self.transactions, key=lambda t: t.date_ns)
+        last = max(self.transactions, key=lambda t: t.date_ns)
+        return first.date, last.date
\ No newline at end of file
@@ -1,31 +1,37 @@
 # analyzers/subscription_manager.py
 # manage both auto-detected + manual subscriptions
 
+import heapq
 import json
 from pathlib import Path
 from datetime import datetime
 from models.subscription import ManualSubscription
 from analyzers.subscriptions import SubscriptionDetector
+from analyzers.json_cache import mtime_cached
+from analyzers.query_cache import QueryCacheMixin
 
-class SubscriptionManager:
+class SubscriptionManager(QueryCacheMixin):
     """manage manual + detected subscriptions"""
 
     def __init__(self, config_path: str = "data/subscriptions.json"):
         self.config_path = Path(config_path)
-        self.manual_subscriptions = []
-        self._load_manual()
+        self._query_cache = {}
+        loaded = self._load_manual()
+        if loaded is not None:
+            print(f"✅ loaded {len(loaded)} manual subscriptions")
+        self.manual_subscriptions = loaded or []
 
+    @mtime_cached(ManualSubscription)
     def _load_manual(self):
-        """load manual subscriptions from file"""
+        """load manual subscriptions from fil (None if missing or unreadable)"""
         if not self.config_path.exists():
-            self.manual_subscriptions = []
-            return
+            return None
 
         try:
-            with open(self.config_path, 'r') as f:
+            with open(self.config_path, 'r', encoding='utf-8') as f:
                 data = json.load(f)
 
-            self.manual_subscriptions = [
+            return [
                 ManualSubscription(
                     name=sub['name'],
                     merchant=sub['merchant'],
@@ -43,13 +49,13 @@ class SubscriptionManager:
                 )
                 for sub in data
             ]
-            print(f"✅ loaded {len(self.manual_subscriptions)} manual subscriptions")
         except Exception as e:
             print(f"⚠️  error loading subscriptions: {e}")
-            self.manual_subscriptions = []
+            return None
 
     def _save_manual(self):
         """save manual subscriptions to file"""
+        self.invalidate_cache()
         data = [
             {
                 "name": sub.name,
@@ -145,9 +151,22 @@ class SubscriptionManager:
 
         print(f"❌ subscription not found: {name}")
 
+    def _by_status(self) -> tuple[list[ManualSubscription], list[ManualSubscription]]:
+        """active / inactive manual subscriptions, split in one pass"""
+        def split():
+            active, inactive = [], []
+            for sub in self.manual_subscriptions:
+                (active if sub.is_active else inactive).append(sub)
+            return active, inactive
+        return self._cached("by_status", split)
+
     def get_active_manual(self) -> list[ManualSubscription]:
         """get all active manual subscriptions"""
-        return [sub for sub in self.manual_subscriptions if sub.is_active]
+        return self._by_status()[0]
+
+    def get_inactive_manual(self) -> list[ManualSubscription]:
+        """get all cancelled manual subscriptions"""
+        return self._by_status()[1]
 
     def get_all_manual(self) -> list[ManualSubscription]:
         """get all manual subscriptions (including inactive)"""
@@ -223,9 +242,7 @@ class SubscriptionManager:
         """generate detailed subscription report"""
         combined = self.combined_recurring(detected_subscriptions or {})
         active_manual = self.get_active_manual()
-        inactive_manual = [
-            s for s in self.manual_subscriptions if not s.is_active
-        ]
+        inactive_manual = self.get_inactive_manual()
 
         output = []
         output.append("=" * 70)
@@ -257,11 +274,11 @@ class SubscriptionManager:
 
             if detected_only:
                 output.append(f"\n--- detected subscriptions ({len(detected_only)}) ---")
-                for merchant, data in sorted(
+                for merchant, data in heapq.nlargest(
+                    10,
                     detected_only,
                     key=lambda x: x[1].get('amount', 0),
-                    reverse=True
-                )[:10]:
+                ):
                     output.append(
                         f"  {merchant:.<35} "
                         f"${data['amount']:>8,.2f} "
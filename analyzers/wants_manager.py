@@ -1,30 +1,36 @@
 # analyzers/wants_manager.py
 # manage wants with cooling-off period
 
+import heapq
 import json
 from pathlib import Path
 from datetime import datetime, timedelta
 from models.want import Want, WantStatus
+from analyzers.json_cache import mtime_cached
+from analyzers.query_cache import QueryCacheMixin
 
-class WantsManager:
+class WantsManager(QueryCacheMixin):
     """manage wants with cooling-off period"""
 
     def __init__(self, config_path: str = "data/wants.json"):
         self.config_path = Path(config_path)
-        self.wants = []
-        self._load_wants()
+        self._query_cache = {}
+        loaded = self._load_wants()
+        if loaded is not None:
+            print(f"✅ loaded {len(loaded)} wants")
+        self.wants = loaded or []
 
+    @mtime_cached(Want)
     def _load_wants(self):
-        """load wants from file"""
+        """load wants from fil (None if missing or unreadable)"""
         if not self.config_path.exists():
-            self.wants = []
-            return
+            return None
 
         try:
-            with open(self.config_path, 'r') as f:
+            with open(self.config_path, 'r', encoding='utf-8') as f:
                 data = json.load(f)
 
-            self.wants = [
+            return [
                 Want(
                     name=want['name'],
                     price=want['price'],
@@ -45,13 +51,13 @@ class WantsManager:
                 )
                 for want in data
             ]
-            print(f"✅ loaded {len(self.wants)} wants")
         except Exception as e:
             print(f"⚠️  error loading wants: {e}")
-            self.wants = []
+            return None
 
     def _save_wants(self):
         """save wants to file"""
+        self.invalidate_cache()
         data = [
             {
                 "name": want.name,
@@ -149,33 +155,37 @@ class WantsManager:
 
         return updated
 
+    def get_all_wants(self) -> list[Want]:
+        """get all wants (any status)"""
+        return self.wants
+
     def get_pending_wants(self) -> list[Want]:
         """get all pending wants"""
-        return [
+        return self._cached("pending", lambda: [
             w for w in self.wants
             if w.status == WantStatus.PENDING
-        ]
+        ])
 
     def get_ready_wants(self) -> list[Want]:
         """get wants ready to purchase"""
-        return [
+        return self._cached("ready", lambda: [
             w for w in self.wants
             if w.is_ready_to_purchase
-        ]
+        ])
 
     def get_completed_wants(self) -> list[Want]:
         """get purchased wants"""
-        return [
+        return self._cached("completed", lambda: [
             w for w in self.wants
             if w.status == WantStatus.PURCHASED
-        ]
+        ])
 
     def get_cancelled_wants(self) -> list[Want]:
         """get cancelled wants"""
-        return [
+        return self._cached("cancelled", lambda: [
             w for w in self.wants
             if w.status == WantStatus.CANCELLED
-        ]
+        ])
 
     def wants_by_category(self) -> dict[str, list[Want]]:
         """organize wants by category"""
@@ -271,7 +281,7 @@ class WantsManager:
         # recently completed
         if completed:
             output.append(f"\n--- 🛒 recently purchased ({len(completed)}) ---")
-            for want in sorted(completed, key=lambda x: x.purchased_date, reverse=True)[:5]:
+            for want in heapq.nlargest(5, completed, key=lambda x: x.purchased_date):
                 output.append(
                     f"  {want.name:.<35} "
                     f"${want.price:>8,.2f} "
@@ -281,7 +291,7 @@ class WantsManager:
         # recently cancelled
         if cancelled:
             output.append(f"\n--- ❌ recently cancelled ({len(cancelled)}) ---")
-            for want in sorted(cancelled, key=lambda x: x.check_in_dates[-1], reverse=True)[:5]:
+            for want in heapq.nlargest(5, cancelled, key=lambda x: x.check_in_dates[-1]):
                 output.append(
                     f"  {want.name:.<35} "
                     f"${want.price:>8,.2f} "
@@ -10,6 +10,7 @@ exclude_categories = [
     "Investment",
     "Loan Payment",
     "Income",
+    "Inflow: Ready to Assign",  # ynab's income/starting-balance category
 ]
 
 # paypal movements to ignore
@@ -19,6 +20,12 @@ paypal_keywords = [
     "APPLE CASH SENT",
 ]
 
+# csv exports to load. the ynab sync writes the first one; add other
+# bank exports here and they are parsed in parallel, one process per file
+transaction_files = [
+    "data/transactions.csv",
+]
+
 # budget targets (monthly)
 budget_targets = {
     "Dining & Drinks": 200,
@@ -51,4 +58,17 @@ house_down_payment = {
     "target_amount": 60000,
     "current_savings": 27000,
     "gap": 33000,
-}
\ No newline at end of file
+}
+
+# report sections to generate. analyzers that only feed a disabled
+# section are skipped entirely. override per machine by writing a json
+# list to data/report_config.json, e.g. ["debt", "spending"]
+report_sections = [
+    "dashboard",   # net worth, cash flow projection, allocation plan
+    "alerts",      # card payment schedule, overdue purchases, inventory
+    "behavior",    # card usage health, wants cooling-off
+    "debt",
+    "spending",
+    "anomalies",
+    "locations",
+]
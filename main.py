@@ -3,6 +3,7 @@
 
 import sys
 import os
+import json
 from pathlib import Path
 
 # fix encoding for Windows console
@@ -16,9 +17,9 @@ sys.path.insert(0, str(Path(__file__).parent))
 
 # --- data ingestion & models ---
 from analyzers.ynab_syncer import YNABSyncer
-from parsers.csv_parser import CSVParser
+from parsers.csv_parser import load_csv_files
 from models.debt import DebtAccount
-from models.transaction import Transaction
+from models.transaction import Transaction, to_epoch_ns
 
 # --- core analyzers ---
 from analyzers.spending import SpendingAnalyzer
@@ -42,6 +43,33 @@ from budget.debt_strategy import DebtStrategy
 
 # --- output ---
 from reports.reporter import Reporter
+import config
+
+
+def load_report_sections(config_path: str = "data/report_config.json") -> set[str]:
+    """
+    returns the report sections to generate.
+    reads a json list from config_path, falling back to config.report_sections.
+    """
+    path = Path(config_path)
+    if not path.exists():
+        return set(config.report_sections)
+
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            sections = json.load(f)
+    except Exception as e:
+        print(f"⚠️  error loading report config: {e}")
+        return set(config.report_sections)
+
+    if not isinstance(sections, list) or not all(isinstance(s, str) for s in sections):
+        print(f"⚠️  report config must be a json list of section names, e.g. {json.dumps(config.report_sections[:2])}")
+        return set(config.report_sections)
+
+    unknown = [s for s in sections if s not in config.report_sections]
+    if unknown:
+        print(f"⚠️  ignoring unknown report sections: {', '.join(unknown)}")
+    return set(sections).difference(unknown)
 
 
 def main():
@@ -59,9 +87,8 @@ def main():
         print(f"⚠️  ynab sync failed: {e}")
         print("   continuing with existing local data...\n")
 
-    # step 2: load transactions from the csv file into memory
-    parser = CSVParser("data/transactions.csv")
-    transactions = parser.load()
+    # step 2: load transactions from the csv file(s) into memory
+    transactions = load_csv_files(config.transaction_files)
 
     if not transactions:
         print("❌ no transactions found. check your csv file or ynab sync setup.")
@@ -72,6 +99,8 @@ def main():
     MONTHLY_INCOME = 4600.0  # estimate your total monthly take-home pay
     CHECKING_ACCOUNT_BALANCE = 2500.0  # your current checking balance
 
+    sections = load_report_sections()
+
     print("\n📊 analyzing spending...")
     spending_analyzer = SpendingAnalyzer(transactions)
     print(f"   total spent (last 90d): ${spending_analyzer.total_spent():,.2f}")
@@ -83,32 +112,46 @@ def main():
     detected_recurring = subscription_detector.find_recurring()
     print(f"   found {len(detected_recurring)} auto-detected recurring charges.")
 
-    print("\n🚨 detecting anomalies...")
-    anomaly_detector = AnomalyDetector(transactions)
+    anomaly_detector = None
+    if "anomalies" in sections:
+        print("\n🚨 detecting anomalies...")
+        anomaly_detector = AnomalyDetector(transactions)
 
-    print("\n📍 analyzing locations...")
-    location_analyzer = LocationAnalyzer(transactions)
+    location_analyzer = None
+    if "locations" in sections:
+        print("\n📍 analyzing locations...")
+        location_analyzer = LocationAnalyzer(transactions)
 
     print("\n🔄 loading recurring purchases manager...")
     recurring_purchases_manager = RecurringPurchasesManager("data/recurring_purchases.json")
 
-    print("\n📦 loading inventory manager...")
-    inventory_manager = InventoryManager("data/inventory.json")
-
-    print("\n💳 loading credit card tracker...")
-    cc_tracker = CreditCardTracker("data/credit_card_charges.json")
-    credit_card_txns = [t for t in transactions if t.account_type.lower() == "credit card"]
-    new_charges_tracked = 0
-    for txn in credit_card_txns:
-        if not any(c.date == txn.date and c.merchant == txn.merchant and c.amount == txn.amount for c in cc_tracker.charges):
-            cc_tracker.add_charge_from_transaction(txn, txn.account_name)
-            new_charges_tracked += 1
-    if new_charges_tracked > 0:
-        print(f"   tracked {new_charges_tracked} new credit card charges.")
-
-    print("\n🛍️  loading wants manager...")
-    wants_manager = WantsManager("data/wants.json")
-    wants_manager.perform_check_ins() # auto-perform monthly check-ins
+    inventory_manager = None
+    if "alerts" in sections:
+        print("\n📦 loading inventory manager...")
+        inventory_manager = InventoryManager("data/inventory.json")
+
+    cc_tracker = None
+    if "alerts" in sections or "behavior" in sections:
+        print("\n💳 loading credit card tracker...")
+        cc_tracker = CreditCardTracker("data/credit_card_charges.json")
+        credit_card_txns = [t for t in transactions if t.account_type.lower() == "credit card"]
+        # key on integer dates so each lookup is a set hit, not a scan of every charge
+        tracked = {(to_epoch_ns(c.date), c.merchant, c.amount) for c in cc_tracker.charges}
+        new_charges_tracked = 0
+        for txn in credit_card_txns:
+            key = (txn.date_ns, txn.merchant, txn.amount)
+            if key not in tracked:
+                cc_tracker.add_charge_from_transaction(txn, txn.account_name)
+                tracked.add(key)
+                new_charges_tracked += 1
+        if new_charges_tracked > 0:
+            print(f"   tracked {new_charges_tracked} new credit card charges.")
+
+    wants_manager = None
+    if "behavior" in sections:
+        print("\n🛍️  loading wants manager...")
+        wants_manager = WantsManager("data/wants.json")
+        wants_manager.perform_check_ins() # auto-perform monthly check-ins
 
     print("\n💰 loading sinking funds...")
     sinking_fund_manager = SinkingFundManager("data/sinking_funds.json")
@@ -124,7 +167,9 @@ def main():
 
     # step 4: initialize the forward-looking strategic analyzers
     print("\n🧠 initializing financial command center...")
-    cash_flow_analyzer = CashFlowAnalyzer(spending_analyzer, subscription_manager, recurring_purchases_manager, debt_analyzer, sinking_fund_manager, monthly_income=MONTHLY_INCOME, checking_balance=CHECKING_ACCOUNT_BALANCE)
+    cash_flow_analyzer = None
+    if "dashboard" in sections:
+        cash_flow_analyzer = CashFlowAnalyzer(spending_analyzer, subscription_manager, recurring_purchases_manager, debt_analyzer, sinking_fund_manager, monthly_income=MONTHLY_INCOME, checking_balance=CHECKING_ACCOUNT_BALANCE)
     budgeter = Budgeter(spending_analyzer)
 
     # step 5: generate the comprehensive report
@@ -147,11 +192,11 @@ def main():
     reporter.sinking_fund_manager = sinking_fund_manager
     reporter.cash_flow_analyzer = cash_flow_analyzer
 
-    report_text = reporter.summary_text()
+    report_text = reporter.summary_text(sections)
     print(report_text)
 
     # step 6: save the report to a file
-    reporter.save_report("data/output/report.txt")
+    reporter.save_report("data/output/report.txt", sections)
 
     print("\n✅ analysis complete!\n")
 
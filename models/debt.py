@@ -4,7 +4,7 @@
 from dataclasses import dataclass
 from datetime import datetime
 
-@dataclass
+@dataclass(slots=True)
 class DebtAccount:
     """represents a debt account (credit card, loan, etc)"""
     name: str
@@ -1,12 +1,21 @@
 # models/transaction.py
 # transaction data model
 
-from datetime import datetime
-from dataclasses import dataclass
+from datetime import datetime, timedelta
+from dataclasses import dataclass, field
 
-@dataclass
+_EPOCH = datetime(1970, 1, 1)
+_ONE_MICROSECOND = timedelta(microseconds=1)
+
+
+def to_epoch_ns(dt: datetime) -> int:
+    """naive datetime -> integer nanoseconds since 1970-01-01 (no timezone math)"""
+    return (dt - _EPOCH) // _ONE_MICROSECOND * 1000
+
+
+@dataclass(slots=True, frozen=True)
 class Transaction:
-    """represents a single transaction"""
+    """represents a single transaction (immutable once parsed)"""
     date: datetime
     account_type: str
     account_name: str
@@ -17,6 +26,71 @@ class Transaction:
     category: str
     notes: str = ""
     source: str = "csv"  # "ynab" or "csv" - tracks where transaction came from
+    # integer copy of `date` for cheap comparisons/hashing in bulk scans
+    date_ns: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # frozen: derived fields go through object.__setattr__
+        object.__setattr__(self, "date_ns", to_epoch_ns(self.date))
+
+    @classmethod
+    def bulk_from_columns(
+        cls,
+        dates: list[datetime],
+        account_types: list[str],
+        account_names: list[str],
+        institutions: list[str],
+        merchants: list[str],
+        amounts: list[float],
+        descriptions: list[str],
+        categories: list[str],
+        sources: list[str],
+        dates_ns: list[int] | None = None,
+    ) -> list["Transaction"]:
+        """
+        build many transactions from parallel column lists.
+        skips __init__ and writes the slots directly, which is much cheaper
+        than calling Transaction(...) once per row on large exports.
+        dates_ns can be passed when the caller already has epoch integers.
+        """
+        if dates_ns is None:
+            dates_ns = [to_epoch_ns(d) for d in dates]
+
+        # the class is frozen, so write through the slot descriptors directly
+        # (what object.__setattr__ would do, minus the per-call lookup)
+        set_date = cls.date.__set__
+        set_date_ns = cls.date_ns.__set__
+        set_account_type = cls.account_type.__set__
+        set_account_name = cls.account_name.__set__
+        set_institution = cls.institution.__set__
+        set_merchant = cls.merchant.__set__
+        set_amount = cls.amount.__set__
+        set_description = cls.description.__set__
+        set_category = cls.category.__set__
+        set_notes = cls.notes.__set__
+        set_source = cls.source.__set__
+
+        new = object.__new__
+        txns = []
+        append = txns.append
+        for date, date_ns, account_type, account_name, institution, merchant, amount, description, category, source in zip(
+            dates, dates_ns, account_types, account_names, institutions, merchants,
+            amounts, descriptions, categories, sources,
+        ):
+            txn = new(cls)
+            set_date(txn, date)
+            set_date_ns(txn, date_ns)
+            set_account_type(txn, account_type)
+            set_account_name(txn, account_name)
+            set_institution(txn, institution)
+            set_merchant(txn, merchant)
+            set_amount(txn, amount)
+            set_description(txn, description)
+            set_category(txn, category)
+            set_notes(txn, "")
+            set_source(txn, source)
+            append(txn)
+        return txns
 
     @property
     def is_income(self) -> bool:
@@ -36,4 +110,4 @@ class Transaction:
             f"amount=${abs(self.amount):.2f}, "
             f"category={self.category}"
             ")"
-        )
\ No newline at end of file
+        )
@@ -1,88 +1,319 @@
+import hashlib
+import itertools
+import multiprocessing
+import os
+import re
+import numpy as np
 import pandas as pd
 from datetime import datetime
+from functools import lru_cache
+from pathlib import Path
 from models.transaction import Transaction
+from analyzers.json_cache import model_version, read_sidecar, write_sidecar
 import config
 
+# optional: pyarrow's multi-threaded csv reader (pip install pyarrow)
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+except ImportError:
+    pa = pacsv = None
+
+# date formats seen in bank exports, tried in order (first match wins),
+# each paired with a pattern that only the strings it can parse will match
+_DATE_MATCHERS = [
+    (re.compile(r'\d{4}-\d{1,2}-\d{1,2}'), '%Y-%m-%d'),
+    (re.compile(r'\d{1,2}-\d{1,2}-\d{2}'), '%d-%m-%y'),
+    (re.compile(r'\d{1,2}/\d{1,2}/\d{4}'), '%m/%d/%Y'),
+    (re.compile(r'\d{4}/\d{1,2}/\d{1,2}'), '%Y/%m/%d'),
+]
+DATE_FORMATS = [fmt for _, fmt in _DATE_MATCHERS]
+
+# rows per read_csv chunk; bounds peak memory on multi-million row exports
+CHUNK_SIZE = 100_000
+# bytes per arrow record batch, roughly CHUNK_SIZE rows of a typical export
+ARROW_BLOCK_SIZE = 16 << 20
+
+# parsed transactions are pickled here, one file per csv, and reused while
+# the csv (mtime + size), the filters in config and the Transaction fields
+# are unchanged
+CACHE_DIR = Path.home() / ".cache" / "money-manager"
+
+# normalized columns the parser reads; everything else is skipped at read time
+_USED_COLUMNS = {
+    'date', 'original date', 'account type', 'account name',
+    'institution name', 'name', 'amount', 'description', 'category', 'source',
+}
+# low-cardinality text columns, stored as int codes + one copy of each label
+_CATEGORY_COLUMNS = {'account type', 'account name', 'institution name', 'category', 'source'}
+
+# paypal movements to ignore, matched in one case-insensitive pass
+_PAYPAL_RE = (
+    re.compile('|'.join(re.escape(kw) for kw in config.paypal_keywords), re.IGNORECASE)
+    if config.paypal_keywords
+    else None
+)
+
+@lru_cache(maxsize=65536)
+def _parse_date(date_str: str) -> datetime | None:
+    """
+    parse a date string with whichever of DATE_FORMATS fits.
+    memoized on the raw string; only the format whose pattern matches is
+    handed to strptime, so well-formed dates never raise.
+    """
+    if not isinstance(date_str, str):
+        return None
+
+    for pattern, fmt in _DATE_MATCHERS:
+        if pattern.fullmatch(date_str):
+            try:
+                return datetime.strptime(date_str, fmt)
+            except ValueError:
+                # right shape, impossible date (e.g. month 13)
+                return None
+
+    return None
+
+
 class CSVParser:
     """parse bank/credit card csv exports"""
 
-    def __init__(self, filepath: str):
+    def __init__(self, filepath: str, chunksize: int = CHUNK_SIZE, engine: str = "arrow", use_cache: bool = True):
+        """
+        engine: "pandas" filters whole chunks with vectorized column ops;
+        "arrow" does the same but tokenizes with pyarrow's threaded reader
+        (falls back to "pandas" when pyarrow isn't installed).
+        both end in _parse_frame, so the filtering rules live in one place.
+        use_cache: reuse the pickled result of the last parse of this file
+        while it is unchanged (see CACHE_DIR).
+        """
+        if engine not in ("pandas", "arrow"):
+            raise ValueError(f"unknown csv engine: {engine}")
+        if engine == "arrow" and pacsv is None:
+            engine = "pandas"
         self.filepath = filepath
-        self.df = None
+        self.chunksize = chunksize
+        self.engine = engine
+        self.use_cache = use_cache
         self.transactions = []
 
     def load(self) -> list[Transaction]:
         """load and parse csv file"""
         print(f"📂 loading {self.filepath}...")
 
-        # read csv
-        self.df = pd.read_csv(self.filepath)
-
-        # normalize column names (handle variations)
-        self.df.columns = [col.strip().lower() for col in self.df.columns]
-
-        print(f"   found {len(self.df)} raw records")
-
-        # parse each row
-        for _, row in self.df.iterrows():
-            txn = self._parse_row(row)
-            if txn:
-                self.transactions.append(txn)
+        cached = self._read_cache() if self.use_cache else None
+        if cached is not None:
+            raw_records, self.transactions = cached
+        else:
+            if self.engine == "arrow":
+                try:
+                    raw_records, self.transactions = self._load_batches()
+                except pa.ArrowInvalid as e:
+                    # arrow rejects ragged rows that pandas pads with blanks
+                    print(f"⚠️  arrow could not parse {self.filepath} ({e}), re-reading with pandas")
+                    raw_records, self.transactions = self._load_chunks()
+            else:
+                raw_records, self.transactions = self._load_chunks()
+            if self.use_cache:
+                self._write_cache(raw_records, self.transactions)
 
+        print(f"   found {raw_records} raw records")
         print(f"   parsed {len(self.transactions)} valid transactions")
         return self.transactions
 
-    def _parse_row(self, row) -> Transaction | None:
-        """convert csv row to transaction object"""
+    def _cache_signature(self) -> tuple | None:
+        """what the cached parse depends on: the file, the filters and the model"""
         try:
-            # extract fields (handle column name variations)
-            date_str = row.get('date') or row.get('original date')
-            amount = float(row.get('amount', 0))
-            merchant = row.get('name', '')
-            category = row.get('category', 'Uncategorized')
-            description = row.get('description', '')
-            account_type = row.get('account type', '')
-            account_name = row.get('account name', '')
-            institution = row.get('institution name', '')
-            source = row.get('source', 'csv')  # default to 'csv' if not specified
-
-            # skip if amount is 0
-            if amount == 0:
-                return None
+            st = os.stat(self.filepath)
+        except OSError:
+            return None
+        return (
+            st.st_mtime_ns,
+            st.st_size,
+            tuple(config.exclude_categories),
+            tuple(config.paypal_keywords),
+            model_version(Transaction),
+        )
 
-            # skip excluded categories
-            if category in config.exclude_categories:
-                return None
+    def _cache_path(self) -> Path:
+        key = hashlib.blake2b(os.path.abspath(self.filepath).encode(), digest_size=8).hexdigest()
+        return CACHE_DIR / f"{key}.pkl"
 
-            # skip paypal transfers (internal movement)
-            if any(kw in description.upper() for kw in config.paypal_keywords):
-                return None
+    def _read_cache(self) -> tuple[int, list[Transaction]] | None:
+        """(raw_records, transactions) from the last parse, if still valid"""
+        signature = self._cache_signature()
+        if signature is None:
+            return None
+        return read_sidecar(self._cache_path(), signature)
 
-            # parse date - try multiple formats
-            date = None
-            for fmt in ['%Y-%m-%d', '%d-%m-%y', '%m/%d/%Y', '%Y/%m/%d']:
-                try:
-                    date = datetime.strptime(date_str, fmt)
-                    break
-                except ValueError:
-                    continue
+    def _write_cache(self, raw_records: int, transactions: list[Transaction]):
+        signature = self._cache_signature()
+        if signature is not None:
+            write_sidecar(self._cache_path(), signature, (raw_records, transactions))
 
-            if not date:
-                return None
+    def _load_chunks(self) -> tuple[int, list[Transaction]]:
+        """read with pandas in chunks and parse each chunk column-wise"""
+        # stream the csv in chunks so memory stays bounded on large exports
+        # (only the columns we use, repetitive text as categoricals)
+        raw_records = 0
+        transactions = []
+        for chunk in pd.read_csv(self.filepath, chunksize=self.chunksize, **self._read_kwargs()):
+            # normalize column names (handle variations)
+            chunk.columns = [col.strip().lower() for col in chunk.columns]
+            raw_records += len(chunk)
+            transactions.extend(self._parse_frame(chunk))
+        return raw_records, transactions
+
+    def _load_batches(self) -> tuple[int, list[Transaction]]:
+        """read with pyarrow in record batches and parse each batch column-wise"""
+        kwargs = self._read_kwargs()
+        # everything stays text except the low-cardinality columns, which
+        # arrow dictionary-encodes (categoricals once in pandas); dates and
+        # amounts are validated by _parse_frame exactly as for the pandas path
+        column_types = {
+            col: pa.dictionary(pa.int32(), pa.string()) if col in kwargs['dtype'] else pa.string()
+            for col in kwargs['usecols']
+        }
+        reader = pacsv.open_csv(
+            self.filepath,
+            read_options=pacsv.ReadOptions(block_size=ARROW_BLOCK_SIZE),
+            convert_options=pacsv.ConvertOptions(
+                include_columns=kwargs['usecols'],
+                column_types=column_types,
+                strings_can_be_null=True,
+            ),
+        )
+        raw_records = 0
+        transactions = []
+        for batch in reader:
+            chunk = batch.to_pandas()
+            # normalize column names (handle variations)
+            chunk.columns = [col.strip().lower() for col in chunk.columns]
+            raw_records += len(chunk)
+            transactions.extend(self._parse_frame(chunk))
+        return raw_records, transactions
+
+    def _read_kwargs(self) -> dict:
+        """
+        build usecols/dtype for read_csv. header names vary in case between
+        exports, so they are matched against the normalized names first.
+        """
+        header = pd.read_csv(self.filepath, nrows=0).columns
+        usecols = [col for col in header if col.strip().lower() in _USED_COLUMNS]
+        dtype = {
+            col: 'category'
+            for col in usecols
+            if col.strip().lower() in _CATEGORY_COLUMNS
+        }
+        return dict(usecols=usecols, dtype=dtype, engine='c')
+
+    def _parse_frame(self, df: pd.DataFrame) -> list[Transaction]:
+        """
+        filter and convert a normalized dataframe to transactions.
+        works column-at-a-time instead of building a Series per row.
+        """
+        df = self._coalesce_duplicate_columns(df)
+
+        def column(name: str, default) -> pd.Series:
+            if name in df.columns:
+                return df[name]
+            return pd.Series(default, index=df.index, dtype=object)
+
+        def filled(series: pd.Series, value: str) -> pd.Series:
+            # categoricals only accept fill values that are already a category
+            if isinstance(series.dtype, pd.CategoricalDtype) and value not in series.cat.categories:
+                series = series.cat.add_categories([value])
+            return series.fillna(value)
+
+        # skip rows with no usable amount (missing, unparseable, nan/inf), or an amount of 0
+        amount = pd.to_numeric(column('amount', 0), errors='coerce')
+        keep = np.isfinite(amount) & (amount != 0)
+
+        # skip excluded categories
+        category = filled(column('category', 'Uncategorized'), 'Uncategorized')
+        keep &= ~category.isin(config.exclude_categories)
+
+        # skip paypal transfers (internal movement)
+        description = filled(column('description', ''), '')
+        if _PAYPAL_RE:
+            keep &= ~description.astype(str).str.contains(_PAYPAL_RE, na=False)
+
+        # parse date - fall back to 'original date' where 'date' is missing
+        date_str = column('date', None)
+        if 'original date' in df.columns:
+            date_str = date_str.fillna(df['original date'])
+        date = self._parse_dates(date_str[keep])
+        keep &= date.reindex(df.index).notna()
+
+        date = date[keep]
+        return Transaction.bulk_from_columns(
+            dates=pd.DatetimeIndex(date).to_pydatetime().tolist(),
+            dates_ns=date.to_numpy().astype('int64').tolist(),
+            account_types=filled(column('account type', '')[keep], '').tolist(),
+            account_names=filled(column('account name', '')[keep], '').tolist(),
+            institutions=filled(column('institution name', '')[keep], '').tolist(),
+            merchants=filled(column('name', '')[keep], '').tolist(),
+            amounts=amount[keep].tolist(),
+            descriptions=description[keep].tolist(),
+            categories=category[keep].tolist(),
+            sources=filled(column('source', 'csv')[keep], 'csv').tolist(),
+        )
+
+    @staticmethod
+    def _parse_dates(date_str: pd.Series) -> pd.Series:
+        """
+        parse each distinct date string once and broadcast the result back.
+        exports repeat the same day across many rows, so the unique set is
+        small: the common format goes through one vectorized pass, then the
+        leftovers through the memoized per-string parser.
+        """
+        codes, uniques = pd.factorize(date_str)
+        unique_str = pd.Series(uniques, dtype=object)
+        parsed = pd.to_datetime(unique_str, format=DATE_FORMATS[0], errors='coerce', cache=True)
+        missing = parsed.isna()
+        if missing.any():
+            parsed[missing] = pd.to_datetime(unique_str[missing].map(_parse_date), errors='coerce')
+        # code -1 marks a missing string; take() fills those with NaT
+        date = pd.Series(
+            pd.DatetimeIndex(parsed).take(codes, allow_fill=True, fill_value=pd.NaT),
+            index=date_str.index,
+        )
+        return date
+
+    @staticmethod
+    def _coalesce_duplicate_columns(df: pd.DataFrame) -> pd.DataFrame:
+        """
+        merge columns that share a name after normalization
+        (e.g. 'Date' and 'date' when ynab rows were appended to a bank export),
+        taking the first non-empty value per row.
+        """
+        if not df.columns.has_duplicates:
+            return df
+        merged = {}
+        for name in dict.fromkeys(df.columns):
+            cols = df.loc[:, df.columns == name]
+            values = cols.iloc[:, 0].astype(object)
+            for i in range(1, cols.shape[1]):
+                values = values.where(values.notna(), cols.iloc[:, i].astype(object))
+            merged[name] = values
+        return pd.DataFrame(merged, index=df.index)
+
+
+def parse_file(filepath: str) -> list[Transaction]:
+    """parse one csv export (module-level so pool workers can pickle it)"""
+    return CSVParser(filepath).load()
+
+
+def load_csv_files(filepaths: list[str], processes: int | None = None) -> list[Transaction]:
+    """
+    parse several csv exports, one worker process per file.
+    files are independent, so this scales with cores; results keep file order.
+    """
+    filepaths = list(filepaths)
+    if len(filepaths) <= 1:
+        # not worth spinning up a pool for a single file
+        return list(itertools.chain.from_iterable(map(parse_file, filepaths)))
 
-            return Transaction(
-                date=date,
-                account_type=account_type,
-                account_name=account_name,
-                institution=institution,
-                merchant=merchant,
-                amount=amount,
-                description=description,
-                category=category,
-                source=source,
-            )
-
-        except Exception as e:
-            # silently skip malformed rows (uncomment below for debugging)
-            # print(f"Error parsing row: {e}")
-            return None
\ No newline at end of file
+    processes = min(processes or multiprocessing.cpu_count(), len(filepaths))
+    with multiprocessing.Pool(processes) as pool:
+        return list(itertools.chain.from_iterable(pool.imap(parse_file, filepaths)))
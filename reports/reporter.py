@@ -1,6 +1,10 @@
 # reports/reporter.py
 # generates a comprehensive, human-readable financial report from all analyzer outputs.
 
+import io
+from array import array
+from itertools import compress, islice
+from collections.abc import Callable, Iterator
 from datetime import datetime
 from analyzers.spending import SpendingAnalyzer
 from analyzers.subscriptions import SubscriptionDetector
@@ -17,6 +21,28 @@ from analyzers.cash_flow_analyzer import CashFlowAnalyzer
 from budget.budgeter import Budgeter
 from budget.debt_strategy import DebtStrategy
 
+# row formatters for the repetitive report tables (bound once, so the
+# template is not re-parsed from an f-string on every row)
+_CATEGORY_ROW = "  {:.<40} ${:>10,.2f} ({:>5.1f}%)\n".format
+_MERCHANT_ROW = "  {:.<40} ${:>10,.2f}\n".format
+_ROW_MONEY = "  {:<30} ${:12,.2f}\n".format
+_ROW_KV35 = "  {:<35} ${:>12,.2f}\n".format
+_ROW_TEXT35 = "  {:<35} {}\n".format
+_FUND_ROW = "    - {:<25} ${:8,.2f} / ${:8,.2f} [{}] {:.1f}%\n".format
+
+_RULE = "=" * 70 + "\n"
+_DASHBOARD_HEADER = _RULE + "FINANCIAL DASHBOARD\n" + _RULE
+
+
+def _banner(title: str) -> str:
+    """a section title between two rules, as one string (one write, not three)"""
+    return f"\n{_RULE}{title}\n{_RULE}"
+
+
+# every possible progress bar at the default length, indexed by filled cells
+_BAR_LENGTH = 25
+_BARS = tuple('█' * i + '─' * (_BAR_LENGTH - i) for i in range(_BAR_LENGTH + 1))
+
 
 class Reporter:
     """
@@ -48,171 +74,225 @@ class Reporter:
         self.wants_manager = None
         self.sinking_fund_manager = None
         self.cash_flow_analyzer = None
+        # analyzer results shared between sections of one report (see _once)
+        self._report_cache = {}
+
+    def _once(self, key: str, compute: Callable):
+        """
+        memoize an analyzer result for the duration of one report.
+        any value more than one section needs must be fetched through here,
+        so each report computes it once however many sections show it.
+        """
+        try:
+            return self._report_cache[key]
+        except KeyError:
+            value = self._report_cache[key] = compute()
+            return value
+
+    def _debt_columns(self) -> tuple[array, bytes]:
+        """
+        the debt accounts projected to parallel columns, built in one pass:
+        balances as a double array, and a 0/1 credit card flag per account.
+        """
+        accounts = self.debt_analyzer.accounts
+        balances = array('d', [acc.current_balance for acc in accounts])
+        is_card = bytes([acc.account_type == 'credit_card' for acc in accounts])
+        return balances, is_card
 
-    def _render_bar(self, value, max_value, length=25):
+    def _render_bar(self, value, max_value, length=_BAR_LENGTH):
         """helper to render a simple text-based progress bar for goals."""
         if max_value <= 0 or value < 0:
-            return '─' * length
+            return _BARS[0] if length == _BAR_LENGTH else '─' * length
         fill_len = int(length * (value / max_value))
+        if length == _BAR_LENGTH and fill_len <= _BAR_LENGTH:
+            return _BARS[fill_len]
+        # other lengths, or an overfunded goal (bar runs past the end)
         return '█' * fill_len + '─' * (length - fill_len)
 
     def generate_financial_dashboard(self) -> str:
         """generates a visual text-based dashboard of overall financial health."""
-        output = []
-        output.append("=" * 70)
-        output.append("FINANCIAL DASHBOARD")
-        output.append("=" * 70)
+        # a standalone dashboard is its own report: start from fresh analyzer data
+        self._report_cache = {}
+        return "".join(self._iter_dashboard()).removesuffix("\n")
+
+    def _iter_dashboard(self) -> Iterator[str]:
+        """the dashboard, one newline-terminated line at a time."""
+        yield _DASHBOARD_HEADER
 
         # assets section
         checking_balance = self.cash_flow_analyzer.checking_balance
         sinking_fund_total = self.sinking_fund_manager.get_total_saved()
         total_assets = checking_balance + sinking_fund_total
-        output.append("\n--- ✅ ASSETS (Liquid) ---")
-        output.append(f"  {'Checking Account:':<30} ${checking_balance:12,.2f}")
-        output.append(f"  {'Sinking Funds Total:':<30} ${sinking_fund_total:12,.2f}")
-        output.append(f"  {'TOTAL LIQUID ASSETS:':<30} ${total_assets:12,.2f}")
+        yield "\n--- ✅ ASSETS (Liquid) ---\n"
+        yield _ROW_MONEY("Checking Account:", checking_balance)
+        yield _ROW_MONEY("Sinking Funds Total:", sinking_fund_total)
+        yield _ROW_MONEY("TOTAL LIQUID ASSETS:", total_assets)
 
         # sinking funds breakdown
         for fund in self.sinking_fund_manager.funds:
             bar = self._render_bar(fund.current_balance, fund.goal_amount)
-            output.append(f"    - {fund.name:<25} ${fund.current_balance:8,.2f} / ${fund.goal_amount:8,.2f} [{bar}] {fund.percentage_complete:.1f}%")
+            yield _FUND_ROW(fund.name, fund.current_balance, fund.goal_amount, bar, fund.percentage_complete)
 
         # liabilities section
-        cc_debt = sum(acc.current_balance for acc in self.debt_analyzer.accounts if acc.account_type == 'credit_card')
-        other_debt = self.debt_analyzer.total_debt() - cc_debt
-        total_liabilities = self.debt_analyzer.total_debt()
-        output.append("\n--- 🚨 LIABILITIES ---")
-        output.append(f"  {'Credit Card Debt:':<30} ${cc_debt:12,.2f}")
-        output.append(f"  {'Other Loans:':<30} ${other_debt:12,.2f}")
-        output.append(f"  {'TOTAL LIABILITIES:':<30} ${total_liabilities:12,.2f}")
+        # sum over the primitive columns, not account attributes
+        balances, is_card = self._once("debt_columns", self._debt_columns)
+        # seeds the total the debt section reads, so it isn't summed twice
+        total_liabilities = self._once("total_debt", lambda: sum(balances))
+        cc_debt = sum(compress(balances, is_card))
+        other_debt = total_liabilities - cc_debt
+        yield "\n--- 🚨 LIABILITIES ---\n"
+        yield _ROW_MONEY("Credit Card Debt:", cc_debt)
+        yield _ROW_MONEY("Other Loans:", other_debt)
+        yield _ROW_MONEY("TOTAL LIABILITIES:", total_liabilities)
 
         # net worth calculation
         net_worth = total_assets - total_liabilities
-        output.append("\n--- NET WORTH (Liquid Estimate) ---")
-        output.append(f"  {'Your Estimated Net Worth:':<30} ${net_worth:12,.2f}")
-        
-        return "\n".join(output)
+        yield "\n--- NET WORTH (Liquid Estimate) ---\n"
+        yield _ROW_MONEY("Your Estimated Net Worth:", net_worth)
+
+    def _iter_sections(self) -> Iterator[tuple[str, Callable[[], Iterator[str]]]]:
+        """
+        yields (name, section) pairs in report order. each section is a
+        generator of text, so nothing is computed until it is consumed.
+        """
+        yield "dashboard", self._section_dashboard
+        yield "alerts", self._section_alerts
+        yield "behavior", self._section_behavior
+        yield "debt", self._section_debt
+        yield "spending", self._section_spending
 
-    def summary_text(self) -> str:
-        """generates the complete, multi-section financial report."""
-        output = []
+    def summary_text(self, sections: set[str] | None = None) -> str:
+        """
+        generates the complete, multi-section financial report.
+        sections limits output to the named sections (default: all); the
+        analyzers behind skipped sections are never called.
+        """
+        buf = io.StringIO()
+        self._write_summary(buf, sections)
+        return buf.getvalue()
 
-        # --- section 1: top-level dashboard & forward-looking plans ---
+    def _write_summary(self, out, sections: set[str] | None = None):
+        """writes the report piece by piece to any file-like object."""
+        self._report_cache = {}
+        for name, section in self._iter_sections():
+            if sections is None or name in sections:
+                out.writelines(section())
+        out.write("\n" + "=" * 70)
+
+    def _section_dashboard(self) -> Iterator[str]:
+        """top-level dashboard & forward-looking plans"""
         if self.cash_flow_analyzer and self.sinking_fund_manager:
-            output.append(self.generate_financial_dashboard())
+            yield from self._iter_dashboard()
 
             projection = self.cash_flow_analyzer.project_checking_account_balance()
-            output.append("\n" + "=" * 70)
-            output.append("CASH FLOW PROJECTION (THIS MONTH)")
-            output.append("=" * 70)
-            output.append(f"  {'Status:':<35} {projection['Buffer Status']}")
-            output.append(f"  {'Start Balance:':<35} ${projection['Start of Month Balance']:>12,.2f}")
-            output.append(f"  {'Projected Income:':<35} ${projection['Projected Income']:>12,.2f}")
-            output.append(f"  {'Projected Outflows (Budgeted):':<35} ${projection['Projected Outflows']:>12,.2f}")
-            output.append(f"  {'PROJECTED END BALANCE:':<35} ${projection['Projected End of Month Balance']:>12,.2f}")
+            yield _banner("CASH FLOW PROJECTION (THIS MONTH)")
+            yield _ROW_TEXT35("Status:", projection['Buffer Status'])
+            yield _ROW_KV35("Start Balance:", projection['Start of Month Balance'])
+            yield _ROW_KV35("Projected Income:", projection['Projected Income'])
+            yield _ROW_KV35("Projected Outflows (Budgeted):", projection['Projected Outflows'])
+            yield _ROW_KV35("PROJECTED END BALANCE:", projection['Projected End of Month Balance'])
 
             plan = self.cash_flow_analyzer.generate_allocation_plan()
-            output.append("\n" + "=" * 70)
-            output.append("MONTHLY ALLOCATION PLAN (Pay Yourself First)")
-            output.append("=" * 70)
+            yield _banner("MONTHLY ALLOCATION PLAN (Pay Yourself First)")
             for key, value in plan.items():
-                output.append(f"  {key:<35} ${value:>12,.2f}")
+                yield _ROW_KV35(key, value)
 
-        # --- section 2: alerts and reminders ---
+    def _section_alerts(self) -> Iterator[str]:
+        """alerts and reminders"""
         if self.cc_tracker:
             schedule = self.cc_tracker.payment_schedule()
-            output.append("\n" + "=" * 70)
-            output.append("ALERTS & REMINDERS")
-            output.append("=" * 70)
-            output.append("\n--- Credit Card Payment Schedule ---")
-            output.append(f"  Total Unpaid Charges Tracked: ${schedule['grand_total']:,.2f}")
-            if schedule.get('next_check_15th', {}).get('charges'):
-                output.append(f"  - Due by 15th: ${schedule['next_check_15th']['total']:,.2f} ({schedule['next_check_15th']['count']} charges)")
-            if schedule.get('next_check_eom', {}).get('charges'):
-                output.append(f"  - Due by End of Month: ${schedule['next_check_eom']['total']:,.2f} ({schedule['next_check_eom']['count']} charges)")
+            yield _banner("ALERTS & REMINDERS")
+            yield "\n--- Credit Card Payment Schedule ---\n"
+            due_15th = schedule.get('next_check_15th', {})
+            due_eom = schedule.get('next_check_eom', {})
+            yield "  Total Unpaid Charges Tracked: $" + format(schedule['grand_total'], ",.2f") + "\n"
+            if due_15th.get('charges'):
+                yield f"  - Due by 15th: ${due_15th['total']:,.2f} ({due_15th['count']} charges)\n"
+            if due_eom.get('charges'):
+                yield f"  - Due by End of Month: ${due_eom['total']:,.2f} ({due_eom['count']} charges)\n"
 
         if self.recurring_purchases_manager:
             overdue = self.recurring_purchases_manager.get_overdue()
             if overdue:
-                output.append(f"\n--- ⚠️ Overdue Recurring Purchases ({len(overdue)}) ---")
+                yield f"\n--- ⚠️ Overdue Recurring Purchases ({len(overdue)}) ---\n"
                 for purchase in overdue[:3]:
-                    output.append(f"  - {purchase.name} (${purchase.amount:,.2f}) was expected on {purchase.next_expected.date()}")
+                    yield f"  - {purchase.name} (${purchase.amount:,.2f}) was expected on {purchase.next_expected.date().isoformat()}\n"
 
         if self.inventory_manager:
             expired = self.inventory_manager.get_expired()
             if expired:
-                output.append(f"\n--- 🚨 Expired Inventory ({len(expired)}) ---")
+                yield f"\n--- 🚨 Expired Inventory ({len(expired)}) ---\n"
                 for item in expired[:3]:
-                    output.append(f"  - {item.name} expired on {item.expiration_date.date()}")
+                    yield f"  - {item.name} expired on {item.expiration_date.date().isoformat()}\n"
             expiring_soon = self.inventory_manager.get_expiring_soon()
             if expiring_soon:
-                output.append(f"\n--- ⏰ Inventory Expiring Soon ({len(expiring_soon)}) ---")
+                yield f"\n--- ⏰ Inventory Expiring Soon ({len(expiring_soon)}) ---\n"
                 for item in expiring_soon[:3]:
-                    output.append(f"  - {item.name} expires in {item.days_until_expiration} days")
+                    yield f"  - {item.name} expires in {item.days_until_expiration} days\n"
 
-        # --- section 3: behavioral finance & goals ---
+    def _section_behavior(self) -> Iterator[str]:
+        """behavioral finance & goals"""
         if self.cc_tracker:
             health = self.cc_tracker.get_usage_health()
-            output.append("\n" + "=" * 70)
-            output.append("BEHAVIORAL FINANCE & GOALS")
-            output.append("=" * 70)
-            output.append("\n--- Credit Card Usage Health (This Month) ---")
-            output.append(f"  {'Status:':<30} {health['Usage Status']}")
-            output.append(f"  {'Total New Charges:':<30} {health['New Charges This Month']} charges")
-            output.append(f"  {'Total Spent on Cards:':<30} ${health['Total Spent on Card This Month']:,.2f}")
-            output.append(f"  {'Recommendation:':<30} {health['Recommendation']}")
+            yield _banner("BEHAVIORAL FINANCE & GOALS")
+            yield "\n--- Credit Card Usage Health (This Month) ---\n"
+            yield f"  {'Status:':<30} {health['Usage Status']}\n"
+            yield f"  {'Total New Charges:':<30} {health['New Charges This Month']} charges\n"
+            yield f"  {'Total Spent on Cards:':<30} ${health['Total Spent on Card This Month']:,.2f}\n"
+            yield f"  {'Recommendation:':<30} {health['Recommendation']}\n"
 
             # show detailed list of new charges
             if health.get('Charges List'):
-                output.append(f"\n  Recent charges this month:")
+                yield f"\n  Recent charges this month:\n"
                 for charge in health['Charges List']:
-                    output.append(
-                        f"    {charge.date.strftime('%m/%d')} | "
+                    # plain int formatting; strftime re-parses its format on every call
+                    charged = charge.date
+                    yield (
+                        f"    {charged.month:02d}/{charged.day:02d} | "
                         f"{charge.card_name:<20} | "
                         f"{charge.merchant:<30} | "
-                        f"${charge.amount:>8,.2f}"
+                        f"${charge.amount:>8,.2f}\n"
                     )
 
         if self.wants_manager:
             stats = self.wants_manager.cooling_off_stats()
-            output.append("\n--- Wants 'Cooling-Off' Tracker ---")
-            output.append(f"  You have saved ${stats['savings_from_cooling']:,.2f} by canceling {stats['cancellation_rate']:.0f}% of wants.")
+            yield "\n--- Wants 'Cooling-Off' Tracker ---\n"
+            yield f"  You have saved ${stats['savings_from_cooling']:,.2f} by canceling {stats['cancellation_rate']:.0f}% of wants.\n"
             ready = self.wants_manager.get_ready_wants()
             if ready:
-                output.append(f"  - You have {len(ready)} item(s) ready for purchase after 3 check-ins.")
-
-        # --- section 4: debt deep dive ---
-        if self.debt_analyzer:
-            output.append("\n" + "=" * 70)
-            output.append("DEBT ANALYSIS")
-            output.append("=" * 70)
-            output.append(f"  {'Total Debt:':<25} ${self.debt_analyzer.total_debt():,.2f}")
-            output.append(f"  {'Avg. Interest Rate:':<25} {self.debt_analyzer.avg_interest_rate() * 100:.2f}%")
-            output.append(f"  {'Est. Monthly Interest:':<25} ${self.debt_analyzer.total_monthly_interest():,.2f}")
-            utilization = self.debt_analyzer.utilization_impact()
+                yield f"  - You have {len(ready)} item(s) ready for purchase after 3 check-ins.\n"
+
+    def _section_debt(self) -> Iterator[str]:
+        """debt deep dive"""
+        debt = self.debt_analyzer
+        if debt:
+            total_debt = self._once("total_debt", debt.total_debt)
+            yield _banner("DEBT ANALYSIS")
+            yield f"  {'Total Debt:':<25} ${total_debt:,.2f}\n"
+            yield f"  {'Avg. Interest Rate:':<25} {debt.avg_interest_rate() * 100:.2f}%\n"
+            yield f"  {'Est. Monthly Interest:':<25} ${debt.total_monthly_interest():,.2f}\n"
+            utilization = debt.utilization_impact()
             if utilization:
-                output.append(f"  {'Credit Utilization:':<25} {utilization['overall_utilization']:.1f}% ({utilization['credit_score_impact']})")
-
-        # --- section 5: historical spending review ---
-        min_date, max_date = self.spending.get_date_range()
-        output.append("\n" + "=" * 70)
-        output.append(f"HISTORICAL SPENDING REVIEW ({min_date.strftime('%b %Y')} - {max_date.strftime('%b %Y')})")
-        output.append("=" * 70)
-        output.append("\n--- Spending by Category ---")
-        for cat, amount in list(self.spending.by_category().items())[:7]:
-            pct = (amount / self.spending.total_spent()) * 100
-            output.append(f"  {cat:.<40} ${amount:>10,.2f} ({pct:>5.1f}%)")
-        
-        output.append("\n--- Top Merchants ---")
-        for merchant, amount in self.spending.top_merchants(5):
-            output.append(f"  {merchant:.<40} ${amount:>10,.2f}")
-
-        # --- final save ---
-        output.append("\n" + "=" * 70)
-        return "\n".join(output)
-
-    def save_report(self, filepath: str):
+                yield f"  {'Credit Utilization:':<25} {utilization['overall_utilization']:.1f}% ({utilization['credit_score_impact']})\n"
+
+    def _section_spending(self) -> Iterator[str]:
+        """historical spending review"""
+        stats = self._once("spending", self.spending.compute_core_stats)
+        min_date, max_date = stats["date_range"]
+        total_spent = stats["total_spent"]
+        yield _banner(f"HISTORICAL SPENDING REVIEW ({min_date.strftime('%b %Y')} - {max_date.strftime('%b %Y')})")
+        yield "\n--- Spending by Category ---\n"
+        for cat, amount in islice(stats["by_category"].items(), 7):
+            pct = (amount / total_spent) * 100
+            yield _CATEGORY_ROW(cat, amount, pct)
+
+        yield "\n--- Top Merchants ---\n"
+        for merchant, amount in stats["top_merchants"][:5]:
+            yield _MERCHANT_ROW(merchant, amount)
+
+    def save_report(self, filepath: str, sections: set[str] | None = None):
         """saves the generated report to a text file."""
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(self.summary_text())
+        # stream straight to disk instead of building the whole string first
+        with open(filepath, 'w', encoding='utf-8', buffering=1 << 20) as f:
+            self._write_summary(f, sections)
         print(f"✅ report saved to {filepath}")
\ No newline at end of file
@@ -16,13 +16,15 @@ def find_budgets():
         print("   please add your token and try again.")
         return
 
-    headers = {'authorization': f'bearer {YNAB_API_TOKEN}'}
     url = 'https://api.youneedabudget.com/v1/budgets'
 
     try:
-        response = requests.get(url, headers=headers)
-        response.raise_for_status() # raises an http error for bad responses
-        data = response.json().get('data', {}).get('budgets', [])
+        # one session, so any follow-up calls reuse the same tls connection
+        with requests.Session() as session:
+            session.headers.update({'authorization': f'bearer {YNAB_API_TOKEN}'})
+            response = session.get(url, timeout=10)
+            response.raise_for_status() # raises an http error for bad responses
+            data = response.json().get('data', {}).get('budgets', [])
 
         if not data:
             print("no budgets found for this api token.")
@@ -5,28 +5,62 @@
 
 import json
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime, timedelta
+from functools import lru_cache
+
+# optional: orjson serializes straight to bytes, several times faster
+try:
+    import orjson
+
+    def _dumps(data) -> bytes:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+except ImportError:
+    def _dumps(data) -> bytes:
+        return json.dumps(data, indent=2).encode('utf-8')
 
 # define the path to the data directory relative to the script location
 DATA_DIR = Path(__file__).parent.parent / "data"
 
+# one clock read for the whole run, so every sample date shares the same "now"
+NOW = datetime.now()
+
+@lru_cache(maxsize=None)
+def _ago(days: int) -> str:
+    """iso timestamp `days` before NOW (memoized; the samples reuse a few offsets)"""
+    return (NOW - timedelta(days=days)).isoformat()
+
+@lru_cache(maxsize=None)
+def _hence(days: int) -> str:
+    """iso timestamp `days` after NOW"""
+    return (NOW + timedelta(days=days)).isoformat()
+
 def create_json_file(file_path: Path, data: list, overwrite: bool = False):
     """
     creates a json file from a list of dictionaries.
     will not overwrite an existing file unless the --overwrite flag is used.
     """
-    if file_path.exists() and not overwrite:
+    # stat once: the answer drives both the skip and the status message
+    existed = file_path.exists()
+    if existed and not overwrite:
         print(f"-> skipping '{file_path.name}', file already exists.")
         return
 
     try:
         # ensure the data directory exists
         DATA_DIR.mkdir(exist_ok=True)
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2)
-        status = "overwritten" if overwrite and file_path.exists() else "created"
+        payload = _dumps(data)
+        if overwrite:
+            file_path.write_bytes(payload)
+        else:
+            # exclusive create, so a file that appeared since the check is never clobbered
+            with open(file_path, 'xb') as f:
+                f.write(payload)
+        status = "overwritten" if existed else "created"
         print(f"✅ successfully {status} '{file_path.name}'")
+    except FileExistsError:
+        print(f"-> skipping '{file_path.name}', file already exists.")
     except Exception as e:
         print(f"❌ failed to create '{file_path.name}': {e}")
 
@@ -40,7 +74,7 @@ def generate_sinking_funds_data():
             "current_balance": 27000.0,
             "monthly_contribution": 500.0,
             "target_date": None,
-            "created_date": (datetime.now() - timedelta(days=365)).isoformat()
+            "created_date": _ago(365)
         },
         {
             "name": "🚗 Car Repair Fund",
@@ -48,7 +82,7 @@ def generate_sinking_funds_data():
             "current_balance": 850.0,
             "monthly_contribution": 100.0,
             "target_date": None,
-            "created_date": (datetime.now() - timedelta(days=180)).isoformat()
+            "created_date": _ago(180)
         },
         {
             "name": "🌴 Vacation Fund",
@@ -56,7 +90,7 @@ def generate_sinking_funds_data():
             "current_balance": 400.0,
             "monthly_contribution": 150.0,
             "target_date": None,
-            "created_date": (datetime.now() - timedelta(days=90)).isoformat()
+            "created_date": _ago(90)
         }
     ]
 
@@ -69,7 +103,7 @@ def generate_subscriptions_data():
             "amount": 22.99,
             "category": "Entertainment & Rec.",
             "interval_days": 30,
-            "start_date": (datetime.now() - timedelta(days=700)).isoformat(),
+            "start_date": _ago(700),
             "end_date": None,
             "notes": "Main streaming service.",
             "is_active": True
@@ -80,7 +114,7 @@ def generate_subscriptions_data():
             "amount": 59.88,
             "category": "Software & Tech",
             "interval_days": 365,
-            "start_date": (datetime.now() - timedelta(days=400)).isoformat(),
+            "start_date": _ago(400),
             "end_date": None,
             "notes": "Annual privacy subscription.",
             "is_active": True
@@ -91,8 +125,8 @@ def generate_subscriptions_data():
             "amount": 10.00,
             "category": "Health & Fitness",
             "interval_days": 30,
-            "start_date": (datetime.now() - timedelta(days=800)).isoformat(),
-            "end_date": (datetime.now() - timedelta(days=100)).isoformat(),
+            "start_date": _ago(800),
+            "end_date": _ago(100),
             "notes": "Cancelled this a few months ago.",
             "is_active": False
         }
@@ -108,11 +142,11 @@ def generate_recurring_purchases_data():
             "category": "Shopping",
             "frequency": "monthly",
             "interval_days": 30,
-            "last_purchase": (datetime.now() - timedelta(days=15)).isoformat(),
-            "next_expected": (datetime.now() + timedelta(days=15)).isoformat(),
+            "last_purchase": _ago(15),
+            "next_expected": _hence(15),
             "notes": "Large bag of kibble.",
             "is_active": True,
-            "purchase_history": [(datetime.now() - timedelta(days=15)).isoformat()]
+            "purchase_history": [_ago(15)]
         },
         {
             "name": "Furnace Air Filters",
@@ -121,11 +155,11 @@ def generate_recurring_purchases_data():
             "category": "Shopping",
             "frequency": "quarterly",
             "interval_days": 90,
-            "last_purchase": (datetime.now() - timedelta(days=80)).isoformat(),
-            "next_expected": (datetime.now() + timedelta(days=10)).isoformat(),
+            "last_purchase": _ago(80),
+            "next_expected": _hence(10),
             "notes": "Remember to change these on time.",
             "is_active": True,
-            "purchase_history": [(datetime.now() - timedelta(days=80)).isoformat()]
+            "purchase_history": [_ago(80)]
         }
     ]
 
@@ -137,9 +171,9 @@ def generate_wants_data():
             "price": 250.0,
             "category": "Electronics",
             "reason": "For better typing experience at home office.",
-            "created": (datetime.now() - timedelta(days=40)).isoformat(),
+            "created": _ago(40),
             "status": "pending",
-            "check_in_dates": [(datetime.now() - timedelta(days=10)).isoformat()],
+            "check_in_dates": [_ago(10)],
             "purchased_date": None,
             "notes": "Currently has 1/3 check-ins."
         },
@@ -148,9 +182,9 @@ def generate_wants_data():
             "price": 800.0,
             "category": "Furniture",
             "reason": "Thought it would help with back pain.",
-            "created": (datetime.now() - timedelta(days=70)).isoformat(),
+            "created": _ago(70),
             "status": "cancelled",
-            "check_in_dates": [(datetime.now() - timedelta(days=40)).isoformat(), (datetime.now() - timedelta(days=10)).isoformat()],
+            "check_in_dates": [_ago(40), _ago(10)],
             "purchased_date": None,
             "notes": "Decided it was too expensive after the second check-in."
         }
@@ -162,8 +196,8 @@ def generate_inventory_data():
         {
             "name": "Emergency Water Bottle Case",
             "category": "Emergency",
-            "purchase_date": (datetime.now() - timedelta(days=300)).isoformat(),
-            "expiration_date": (datetime.now() + timedelta(days=400)).isoformat(),
+            "purchase_date": _ago(300),
+            "expiration_date": _hence(400),
             "quantity": 1,
             "unit": "case",
             "location": "Basement Shelf",
@@ -173,8 +207,8 @@ def generate_inventory_data():
         {
             "name": "First Aid Kit Supplies",
             "category": "Emergency",
-            "purchase_date": (datetime.now() - timedelta(days=1000)).isoformat(),
-            "expiration_date": (datetime.now() - timedelta(days=10)).isoformat(),
+            "purchase_date": _ago(1000),
+            "expiration_date": _ago(10),
             "quantity": 1,
             "unit": "kit",
             "location": "Car Trunk",
@@ -187,7 +221,7 @@ def generate_credit_card_charges_data():
     """generates sample data for the credit card tracker."""
     return [
         {
-            "date": (datetime.now() - timedelta(days=20)).isoformat(),
+            "date": _ago(20),
             "merchant": "Some Online Store",
             "amount": 112.50,
             "category": "Shopping",
@@ -197,7 +231,7 @@ def generate_credit_card_charges_data():
             "notes": "This will be on the end-of-month payment plan."
         },
         {
-            "date": (datetime.now() - timedelta(days=5)).isoformat(),
+            "date": _ago(5),
             "merchant": "Local Restaurant",
             "amount": 88.20,
             "category": "Dining & Drinks",
@@ -208,25 +242,30 @@ def generate_credit_card_charges_data():
         }
     ]
 
+def generate_all_data() -> dict[str, list]:
+    """builds every sample payload, keyed by the file it belongs in."""
+    return {
+        "sinking_funds.json": generate_sinking_funds_data(),
+        "subscriptions.json": generate_subscriptions_data(),
+        "recurring_purchases.json": generate_recurring_purchases_data(),
+        "wants.json": generate_wants_data(),
+        "inventory.json": generate_inventory_data(),
+        "credit_card_charges.json": generate_credit_card_charges_data(),
+    }
+
 def main(overwrite: bool):
     """main function to generate all data files."""
     print("--- initializing data files ---")
-    
-    # define all the files and their data-generating functions
-    files_to_create = {
-        "sinking_funds.json": generate_sinking_funds_data,
-        "subscriptions.json": generate_subscriptions_data,
-        "recurring_purchases.json": generate_recurring_purchases_data,
-        "wants.json": generate_wants_data,
-        "inventory.json": generate_inventory_data,
-        "credit_card_charges.json": generate_credit_card_charges_data,
-    }
-    
-    for filename, generator_func in files_to_create.items():
-        file_path = DATA_DIR / filename
-        data = generator_func()
-        create_json_file(file_path, data, overwrite)
-        
+
+    payloads = generate_all_data()
+
+    # each payload goes to its own file, so the writes can overlap
+    with ThreadPoolExecutor(max_workers=len(payloads)) as executor:
+        list(executor.map(
+            lambda item: create_json_file(DATA_DIR / item[0], item[1], overwrite),
+            payloads.items(),
+        ))
+
     print("\n✅ data initialization complete.")
     print("you can now run `python main.py` without errors.")
     if not overwrite:
@@ -9,54 +9,114 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from analyzers.recurring_purchases_manager import RecurringPurchasesManager
 from models.recurring_purchase import PurchaseFrequency
+from scripts.menu_io import parse_amount, parse_days, parse_int, prompt, write_screen
+
+def _read(text: str, parse, retries: int = 3):
+    """
+    prompt until parse (one of the menu_io validators) accepts the answer.
+    returns None once `retries` answers in a row were invalid.
+    """
+    for _ in range(retries):
+        value = parse(prompt(text))
+        if value is not None:
+            return value
+        print("invalid input")
+    return None
+
+def _parse_date(text: str) -> datetime | None:
+    """YYYY-MM-DD, blank for today; None if it doesn't parse"""
+    text = text.strip()
+    if not text:
+        return datetime.now()
+    try:
+        return datetime.strptime(text, "%Y-%m-%d")
+    except ValueError:
+        return None
+
+def _read_index(text: str, count: int) -> int | None:
+    """1-based menu number -> 0-based index, or None if out of range/invalid"""
+    choice = _read(text, parse_int)
+    if choice is None:
+        return None
+    if not 1 <= choice <= count:
+        print("invalid selection")
+        return None
+    return choice - 1
+
+_MENU = """
+--- recurring purchases manager ---
+1. list purchases
+2. add purchase
+3. record purchase
+4. snooze purchase
+5. deactivate/reactivate purchase
+6. show report
+7. exit
+
+"""
 
 def print_menu():
     """print main menu"""
-    print("\n--- recurring purchases manager ---")
-    print("1. list purchases")
-    print("2. add purchase")
-    print("3. record purchase")
-    print("4. snooze purchase")
-    print("5. deactivate/reactivate purchase")
-    print("6. show report")
-    print("7. exit")
-    print()
-
-def list_purchases(manager: RecurringPurchasesManager):
+    sys.stdout.write(_MENU)
+
+def _snapshot(manager: RecurringPurchasesManager) -> tuple[list, list, list]:
+    """
+    (active, due_soon, overdue) in one pass over the purchases.
+    same rules as the manager's get_* methods, which each rescan the list.
+    """
+    active, due_soon, overdue = [], [], []
+    for purchase in manager.purchases:
+        if not purchase.is_active:
+            continue
+        active.append(purchase)
+        if purchase.is_due_soon:
+            due_soon.append(purchase)
+        if purchase.is_overdue:
+            overdue.append(purchase)
+    return active, due_soon, overdue
+
+def list_purchases(manager: RecurringPurchasesManager, snapshot: tuple = None):
     """list all purchases"""
-    active = manager.get_active_purchases()
-    due_soon = manager.get_due_soon()
-    overdue = manager.get_overdue()
+    active, due_soon, overdue = snapshot or _snapshot(manager)
 
-    print("\n--- overdue purchases ---")
+    lines = ["\n--- overdue purchases ---"]
     if overdue:
-        for i, purchase in enumerate(overdue, 1):
-            print(f"{i}. {purchase.name:.<30} ${purchase.amount:>8,.2f}")
+        lines.extend(
+            f"{i}. {purchase.name:.<30} ${purchase.amount:>8,.2f}"
+            for i, purchase in enumerate(overdue, 1)
+        )
     else:
-        print("(none)")
+        lines.append("(none)")
 
-    print("\n--- due soon ---")
+    lines.append("\n--- due soon ---")
     if due_soon:
-        for i, purchase in enumerate(due_soon, 1):
-            print(f"{i}. {purchase.name:.<30} ${purchase.amount:>8,.2f} (in {purchase.days_until_next} days)")
+        lines.extend(
+            f"{i}. {purchase.name:.<30} ${purchase.amount:>8,.2f} (in {purchase.days_until_next} days)"
+            for i, purchase in enumerate(due_soon, 1)
+        )
     else:
-        print("(none)")
+        lines.append("(none)")
 
-    print("\n--- all active purchases ---")
+    lines.append("\n--- all active purchases ---")
     if active:
-        for i, purchase in enumerate(active, 1):
-            status = "⏰" if purchase.is_due_soon else "⏳"
-            print(f"{i}. {status} {purchase.name:.<30} ${purchase.amount:>8,.2f} ({purchase.frequency.value})")
+        lines.extend(
+            f"{i}. {'⏰' if purchase.is_due_soon else '⏳'} {purchase.name:.<30} ${purchase.amount:>8,.2f} ({purchase.frequency.value})"
+            for i, purchase in enumerate(active, 1)
+        )
     else:
-        print("(none)")
+        lines.append("(none)")
+
+    write_screen(lines)
 
 def add_purchase(manager: RecurringPurchasesManager):
     """add new recurring purchase"""
     print("\n--- add recurring purchase ---")
-    name = input("item name: ").strip()
-    merchant = input("merchant: ").strip()
-    amount = float(input("amount: $"))
-    category = input("category: ").strip()
+    name = prompt("item name: ").strip()
+    merchant = prompt("merchant: ").strip()
+    amount = _read("amount: $", parse_amount)
+    if amount is None:
+        return
+    category = prompt("category: ").strip()
 
     print("\nfrequency options:")
     print("  1: weekly")
@@ -67,7 +127,7 @@ def add_purchase(manager: RecurringPurchasesManager):
     print("  6: annual")
     print("  7: custom")
 
-    freq_choice = input("select frequency (1-7): ").strip()
+    freq_choice = prompt("select frequency (1-7): ").strip()
     freq_map = {
         "1": PurchaseFrequency.WEEKLY,
         "2": PurchaseFrequency.BI_WEEKLY,
@@ -82,7 +142,9 @@ def add_purchase(manager: RecurringPurchasesManager):
         frequency = freq_map[freq_choice]
 
         if freq_choice == "7":
-            interval_days = int(input("custom interval in days: "))
+            interval_days = _read("custom interval in days: ", parse_days)
+            if interval_days is None:
+                return
         else:
             interval_days_map = {
                 PurchaseFrequency.WEEKLY: 7,
@@ -98,13 +160,14 @@ def add_purchase(manager: RecurringPurchasesManager):
         frequency = PurchaseFrequency.MONTHLY
         interval_days = 30
 
-    last_purchase_str = input("last purchase date (YYYY-MM-DD) or leave blank for today: ").strip()
-    if last_purchase_str:
-        last_purchase = datetime.strptime(last_purchase_str, "%Y-%m-%d")
-    else:
-        last_purchase = datetime.now()
+    last_purchase = _read(
+        "last purchase date (YYYY-MM-DD) or leave blank for today: ",
+        _parse_date,
+    )
+    if last_purchase is None:
+        return
 
-    notes = input("notes (optional): ").strip()
+    notes = prompt("notes (optional): ").strip()
 
     manager.add_purchase(
         name=name,
@@ -117,9 +180,10 @@ def add_purchase(manager: RecurringPurchasesManager):
         notes=notes,
     )
 
-def record_purchase(manager: RecurringPurchasesManager):
+def record_purchase(manager: RecurringPurchasesManager, active: list = None):
     """record a new purchase"""
-    active = manager.get_active_purchases()
+    if active is None:
+        active = manager.get_active_purchases()
     if not active:
         print("no active purchases")
         return
@@ -128,23 +192,23 @@ def record_purchase(manager: RecurringPurchasesManager):
     for i, purchase in enumerate(active, 1):
         print(f"{i}. {purchase.name}")
 
-    choice = input("select purchase to record (number): ").strip()
-    try:
-        idx = int(choice) - 1
-        if 0 <= idx < len(active):
-            purchase = active[idx]
-            amount_input = input(f"amount (${purchase.amount:.2f}, press enter to use default): ").strip()
-            amount = float(amount_input) if amount_input else None
+    idx = _read_index("select purchase to record (number): ", len(active))
+    if idx is None:
+        return
+    purchase = active[idx]
+    amount = _read(
+        f"amount (${purchase.amount:.2f}, press enter to use default): ",
+        lambda v: parse_amount(v, default=purchase.amount),
+    )
+    if amount is None:
+        return
 
-            manager.record_purchase(purchase.name, amount)
-        else:
-            print("invalid selection")
-    except ValueError:
-        print("invalid input")
+    manager.record_purchase(purchase.name, amount)
 
-def snooze_purchase(manager: RecurringPurchasesManager):
+def snooze_purchase(manager: RecurringPurchasesManager, active: list = None):
     """snooze a purchase"""
-    active = manager.get_active_purchases()
+    if active is None:
+        active = manager.get_active_purchases()
     if not active:
         print("no active purchases")
         return
@@ -153,16 +217,12 @@ def snooze_purchase(manager: RecurringPurchasesManager):
     for i, purchase in enumerate(active, 1):
         print(f"{i}. {purchase.name} (next in {purchase.days_until_next} days)")
 
-    choice = input("select purchase to snooze (number): ").strip()
-    try:
-        idx = int(choice) - 1
-        if 0 <= idx < len(active):
-            days = int(input("snooze for how many days? "))
-            manager.snooze_purchase(active[idx].name, days)
-        else:
-            print("invalid selection")
-    except ValueError:
-        print("invalid input")
+    idx = _read_index("select purchase to snooze (number): ", len(active))
+    if idx is None:
+        return
+    days = _read("snooze for how many days? ", parse_days)
+    if days is not None:
+        manager.snooze_purchase(active[idx].name, days)
 
 def toggle_purchase(manager: RecurringPurchasesManager):
     """activate/deactivate a purchase"""
@@ -176,23 +236,18 @@ def toggle_purchase(manager: RecurringPurchasesManager):
         status = "active" if purchase.is_active else "inactive"
         print(f"{i}. {purchase.name} ({status})")
 
-    choice = input("select purchase to toggle (number): ").strip()
-    try:
-        idx = int(choice) - 1
-        if 0 <= idx < len(all_purchases):
-            purchase = all_purchases[idx]
-            if purchase.is_active:
-                manager.deactivate_purchase(purchase.name)
-            else:
-                manager.reactivate_purchase(purchase.name)
-        else:
-            print("invalid selection")
-    except ValueError:
-        print("invalid input")
+    idx = _read_index("select purchase to toggle (number): ", len(all_purchases))
+    if idx is None:
+        return
+    purchase = all_purchases[idx]
+    if purchase.is_active:
+        manager.deactivate_purchase(purchase.name)
+    else:
+        manager.reactivate_purchase(purchase.name)
 
 def show_report(manager: RecurringPurchasesManager):
     """show detailed report"""
-    print(manager.purchases_report())
+    sys.stdout.write(manager.purchases_report() + "\n")
 
 def main():
     """main loop"""
@@ -200,16 +255,23 @@ def main():
 
     while True:
         print_menu()
-        choice = input("select option: ").strip()
+        try:
+            choice = prompt("select option: ").strip()
+        except EOFError:
+            print("\n👋 bye!")
+            break
+
+        # one scan per menu cycle, shared by whichever action runs
+        snapshot = _snapshot(manager) if choice in ("1", "3", "4") else None
 
         if choice == "1":
-            list_purchases(manager)
+            list_purchases(manager, snapshot)
         elif choice == "2":
             add_purchase(manager)
         elif choice == "3":
-            record_purchase(manager)
+            record_purchase(manager, snapshot[0])
         elif choice == "4":
-            snooze_purchase(manager)
+            snooze_purchase(manager, snapshot[0])
         elif choice == "5":
             toggle_purchase(manager)
         elif choice == "6":
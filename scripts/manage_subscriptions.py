@@ -8,6 +8,11 @@ from datetime import datetime
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from analyzers.subscription_manager import SubscriptionManager
+from scripts.menu_io import parse_amount, parse_days, parse_int, prompt, write_screen
+
+# rows of the active / cancelled subscription listings
+_ACTIVE_ROW = "{}. {:.<30} ${:>8,.2f} ({}) → ${:>8,.2f}/mo".format
+_CANCELLED_ROW = "{}. {} (cancelled)".format
 
 def print_menu():
     """print main menu"""
@@ -24,41 +29,46 @@ def print_menu():
 def list_subscriptions(manager: SubscriptionManager):
     """list all subscriptions"""
     active = manager.get_active_manual()
-    inactive = [s for s in manager.get_all_manual() if not s.is_active]
+    inactive = manager.get_inactive_manual()
 
-    print("\n--- active subscriptions ---")
+    lines = ["\n--- active subscriptions ---"]
     if active:
+        append = lines.append
         for i, sub in enumerate(active, 1):
-            print(
-                f"{i}. {sub.name:.<30} "
-                f"${sub.amount:>8,.2f} ({sub.interval_type}) "
-                f"→ ${sub.monthly_cost():>8,.2f}/mo"
-            )
+            # monthly cost stays a plain call: update_subscription edits
+            # amount/interval in place, so memoizing it on the object would go stale
+            append(_ACTIVE_ROW(i, sub.name, sub.amount, sub.interval_type, sub.monthly_cost()))
     else:
-        print("(none)")
+        lines.append("(none)")
 
     if inactive:
-        print("\n--- cancelled subscriptions ---")
-        for i, sub in enumerate(inactive, 1):
-            print(f"{i}. {sub.name} (cancelled)")
+        lines.append("\n--- cancelled subscriptions ---")
+        lines.extend(_CANCELLED_ROW(i, sub.name) for i, sub in enumerate(inactive, 1))
+
+    write_screen(lines)
 
 def add_subscription(manager: SubscriptionManager):
     """add new subscription"""
     print("\n--- add subscription ---")
-    name = input("subscription name: ").strip()
-    merchant = input("merchant: ").strip()
-    amount = float(input("amount: $"))
-    category = input("category (e.g., 'Software & Tech'): ").strip()
+    name = prompt("subscription name: ").strip()
+    merchant = prompt("merchant: ").strip()
+    amount = parse_amount(prompt("amount: $"))
+    if amount is None:
+        print("invalid amount")
+        return
+    category = prompt("category (e.g., 'Software & Tech'): ").strip()
 
     print("\ninterval options:")
     print("  7: weekly")
     print("  14: bi-weekly")
     print("  30: monthly")
     print("  365: annual")
-    interval_input = input("interval days (or custom): ").strip()
-    interval_days = int(interval_input) if interval_input else 30
+    interval_days = parse_days(prompt("interval days (or custom): "), default=30)
+    if interval_days is None:
+        print("invalid interval")
+        return
 
-    notes = input("notes (optional): ").strip()
+    notes = prompt("notes (optional): ").strip()
 
     manager.add_subscription(
         name=name,
@@ -81,19 +91,17 @@ def cancel_subscription(manager: SubscriptionManager):
     for i, sub in enumerate(active, 1):
         print(f"{i}. {sub.name}")
 
-    choice = input("select subscription to cancel (number): ").strip()
-    try:
-        idx = int(choice) - 1
-        if 0 <= idx < len(active):
-            manager.cancel_subscription(active[idx].name)
-        else:
-            print("invalid selection")
-    except ValueError:
+    choice = parse_int(prompt("select subscription to cancel (number): "))
+    if choice is None:
         print("invalid input")
+    elif 1 <= choice <= len(active):
+        manager.cancel_subscription(active[choice - 1].name)
+    else:
+        print("invalid selection")
 
 def reactivate_subscription(manager: SubscriptionManager):
     """reactivate a cancelled subscription"""
-    inactive = [s for s in manager.get_all_manual() if not s.is_active]
+    inactive = manager.get_inactive_manual()
     if not inactive:
         print("no cancelled subscriptions")
         return
@@ -102,15 +110,13 @@ def reactivate_subscription(manager: SubscriptionManager):
     for i, sub in enumerate(inactive, 1):
         print(f"{i}. {sub.name}")
 
-    choice = input("select subscription to reactivate (number): ").strip()
-    try:
-        idx = int(choice) - 1
-        if 0 <= idx < len(inactive):
-            manager.reactivate_subscription(inactive[idx].name)
-        else:
-            print("invalid selection")
-    except ValueError:
+    choice = parse_int(prompt("select subscription to reactivate (number): "))
+    if choice is None:
         print("invalid input")
+    elif 1 <= choice <= len(inactive):
+        manager.reactivate_subscription(inactive[choice - 1].name)
+    else:
+        print("invalid selection")
 
 def update_subscription(manager: SubscriptionManager):
     """update subscription details"""
@@ -123,56 +129,67 @@ def update_subscription(manager: SubscriptionManager):
     for i, sub in enumerate(active, 1):
         print(f"{i}. {sub.name}")
 
-    choice = input("select subscription to update (number): ").strip()
-    try:
-        idx = int(choice) - 1
-        if 0 <= idx < len(active):
-            sub = active[idx]
-            print(f"\nupdating: {sub.name}")
-            print("(leave blank to skip)")
-
-            amount_input = input(f"amount (${sub.amount:.2f}): ").strip()
-            interval_input = input(f"interval days ({sub.interval_days}): ").strip()
-            notes_input = input(f"notes ({sub.notes}): ").strip()
-
-            manager.update_subscription(
-                sub.name,
-                amount=float(amount_input) if amount_input else None,
-                interval_days=int(interval_input) if interval_input else None,
-                notes=notes_input if notes_input else None,
-            )
-        else:
-            print("invalid selection")
-    except ValueError:
+    choice = parse_int(prompt("select subscription to update (number): "))
+    if choice is None:
+        print("invalid input")
+        return
+    if not 1 <= choice <= len(active):
+        print("invalid selection")
+        return
+
+    sub = active[choice - 1]
+    print(f"\nupdating: {sub.name}")
+    print("(leave blank to skip)")
+
+    amount_input = prompt(f"amount (${sub.amount:.2f}): ").strip()
+    interval_input = prompt(f"interval days ({sub.interval_days}): ").strip()
+    notes_input = prompt(f"notes ({sub.notes}): ").strip()
+
+    amount = parse_amount(amount_input)
+    interval_days = parse_days(interval_input)
+    if (amount_input and amount is None) or (interval_input and interval_days is None):
         print("invalid input")
+        return
+
+    manager.update_subscription(
+        sub.name,
+        amount=amount,
+        interval_days=interval_days,
+        notes=notes_input if notes_input else None,
+    )
 
 def show_report(manager: SubscriptionManager):
     """show detailed report"""
     print(manager.subscription_report())
 
+_DISPATCH = {
+    "1": list_subscriptions,
+    "2": add_subscription,
+    "3": cancel_subscription,
+    "4": reactivate_subscription,
+    "5": update_subscription,
+    "6": show_report,
+}
+
 def main():
     """main loop"""
     manager = SubscriptionManager("data/subscriptions.json")
 
     while True:
         print_menu()
-        choice = input("select option: ").strip()
-
-        if choice == "1":
-            list_subscriptions(manager)
-        elif choice == "2":
-            add_subscription(manager)
-        elif choice == "3":
-            cancel_subscription(manager)
-        elif choice == "4":
-            reactivate_subscription(manager)
-        elif choice == "5":
-            update_subscription(manager)
-        elif choice == "6":
-            show_report(manager)
-        elif choice == "7":
+        try:
+            choice = prompt("select option: ").strip()
+        except EOFError:
+            print("\n👋 bye!")
+            break
+
+        if choice == "7":
             print("👋 bye!")
             break
+
+        handler = _DISPATCH.get(choice)
+        if handler:
+            handler(manager)
         else:
             print("invalid option")
 
@@ -8,6 +8,11 @@ from datetime import datetime
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from analyzers.wants_manager import WantsManager
+from scripts.menu_io import parse_amount, parse_int, prompt, write_screen
+
+# wants listing rows; ready, purchased and cancelled share the price row
+_PRICE_ROW = "{}. {:.<30} ${:>8,.2f}".format
+_PENDING_ROW = "{}. {:.<30} ${:>8,.2f} ({}/3) next in {} days".format
 
 def print_menu():
     """print main menu"""
@@ -28,48 +33,46 @@ def list_wants(manager: WantsManager):
     completed = manager.get_completed_wants()
     cancelled = manager.get_cancelled_wants()
 
-    print("\n--- ready to purchase ---")
+    lines = ["\n--- ready to purchase ---"]
     if ready:
-        for i, want in enumerate(ready, 1):
-            print(f"{i}. {want.name:.<30} ${want.price:>8,.2f}")
+        lines.extend(_PRICE_ROW(i, want.name, want.price) for i, want in enumerate(ready, 1))
     else:
-        print("(none)")
+        lines.append("(none)")
 
-    print("\n--- pending wants ---")
+    lines.append("\n--- pending wants ---")
     if pending:
-        for i, want in enumerate(pending, 1):
-            check_status = f"({want.check_ins_completed}/3)"
-            days_left = want.days_until_next_check_in
-            print(
-                f"{i}. {want.name:.<30} "
-                f"${want.price:>8,.2f} "
-                f"{check_status} next in {days_left} days"
-            )
+        lines.extend(
+            _PENDING_ROW(i, want.name, want.price, want.check_ins_completed, want.days_until_next_check_in)
+            for i, want in enumerate(pending, 1)
+        )
     else:
-        print("(none)")
+        lines.append("(none)")
 
-    print("\n--- purchased wants ---")
+    lines.append("\n--- purchased wants ---")
     if completed:
-        for i, want in enumerate(completed, 1):
-            print(f"{i}. {want.name:.<30} ${want.price:>8,.2f}")
+        lines.extend(_PRICE_ROW(i, want.name, want.price) for i, want in enumerate(completed, 1))
     else:
-        print("(none)")
+        lines.append("(none)")
 
-    print("\n--- cancelled wants ---")
+    lines.append("\n--- cancelled wants ---")
     if cancelled:
-        for i, want in enumerate(cancelled, 1):
-            print(f"{i}. {want.name:.<30} ${want.price:>8,.2f}")
+        lines.extend(_PRICE_ROW(i, want.name, want.price) for i, want in enumerate(cancelled, 1))
     else:
-        print("(none)")
+        lines.append("(none)")
+
+    write_screen(lines)
 
 def add_want(manager: WantsManager):
     """add new want"""
     print("\n--- add want ---")
-    name = input("item name: ").strip()
-    price = float(input("price: $"))
-    category = input("category (e.g., 'Electronics'): ").strip()
-    reason = input("why do you want this? ").strip()
-    notes = input("notes (optional): ").strip()
+    name = prompt("item name: ").strip()
+    price = parse_amount(prompt("price: $"))
+    if price is None:
+        print("invalid amount")
+        return
+    category = prompt("category (e.g., 'Electronics'): ").strip()
+    reason = prompt("why do you want this? ").strip()
+    notes = prompt("notes (optional): ").strip()
 
     manager.add_want(
         name=name,
@@ -90,15 +93,13 @@ def cancel_want(manager: WantsManager):
     for i, want in enumerate(pending, 1):
         print(f"{i}. {want.name}")
 
-    choice = input("select want to cancel (number): ").strip()
-    try:
-        idx = int(choice) - 1
-        if 0 <= idx < len(pending):
-            manager.cancel_want(pending[idx].name)
-        else:
-            print("invalid selection")
-    except ValueError:
+    choice = parse_int(prompt("select want to cancel (number): "))
+    if choice is None:
         print("invalid input")
+    elif 1 <= choice <= len(pending):
+        manager.cancel_want(pending[choice - 1].name)
+    else:
+        print("invalid selection")
 
 def purchase_want(manager: WantsManager):
     """mark a want as purchased"""
@@ -111,15 +112,13 @@ def purchase_want(manager: WantsManager):
     for i, want in enumerate(ready, 1):
         print(f"{i}. {want.name} - ${want.price:.2f}")
 
-    choice = input("select want to purchase (number): ").strip()
-    try:
-        idx = int(choice) - 1
-        if 0 <= idx < len(ready):
-            manager.purchase_want(ready[idx].name)
-        else:
-            print("invalid selection")
-    except ValueError:
+    choice = parse_int(prompt("select want to purchase (number): "))
+    if choice is None:
         print("invalid input")
+    elif 1 <= choice <= len(ready):
+        manager.purchase_want(ready[choice - 1].name)
+    else:
+        print("invalid selection")
 
 def perform_check_ins(manager: WantsManager):
     """perform check-ins for due wants"""
@@ -132,29 +131,34 @@ def show_report(manager: WantsManager):
     """show detailed report"""
     print(manager.want_report())
 
+_DISPATCH = {
+    "1": list_wants,
+    "2": add_want,
+    "3": cancel_want,
+    "4": purchase_want,
+    "5": perform_check_ins,
+    "6": show_report,
+}
+
 def main():
     """main loop"""
     manager = WantsManager("data/wants.json")
 
     while True:
         print_menu()
-        choice = input("select option: ").strip()
-
-        if choice == "1":
-            list_wants(manager)
-        elif choice == "2":
-            add_want(manager)
-        elif choice == "3":
-            cancel_want(manager)
-        elif choice == "4":
-            purchase_want(manager)
-        elif choice == "5":
-            perform_check_ins(manager)
-        elif choice == "6":
-            show_report(manager)
-        elif choice == "7":
+        try:
+            choice = prompt("select option: ").strip()
+        except EOFError:
+            print("\n👋 bye!")
+            break
+
+        if choice == "7":
             print("👋 bye!")
             break
+
+        handler = _DISPATCH.get(choice)
+        if handler:
+            handler(manager)
         else:
             print("invalid option")
 
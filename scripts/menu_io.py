@@ -0,0 +1,56 @@
+# scripts/menu_io.py
+# stdin/stdout helpers and input validators shared by the interactive manager menus
+
+import math
+import sys
+
+def prompt(text: str) -> str:
+    """
+    write a prompt and read one line from the buffered stdin stream,
+    skipping input()'s per-call tty checks. raises EOFError at end of
+    input like input() does.
+    """
+    sys.stdout.write(text)
+    sys.stdout.flush()
+    line = sys.stdin.readline()
+    if not line:
+        raise EOFError
+    return line.rstrip("\n")
+
+def write_screen(lines: list[str]):
+    """
+    write a listing screen built up as a list of lines. the menus collect
+    the whole screen first and emit it with one write, rather than one
+    print per row.
+    """
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
+
+# validators: blank input gives `default`, invalid input gives None, so a
+# menu can tell "use the default" from "try again" with one check
+
+def parse_amount(text: str, default: float | None = None) -> float | None:
+    """a money amount such as "$1,299.99"; nan and inf are rejected"""
+    text = text.strip().lstrip("$").replace(",", "")
+    if not text:
+        return default
+    try:
+        value = float(text)
+    except ValueError:
+        return None
+    return value if math.isfinite(value) else None
+
+def parse_int(text: str, default: int | None = None) -> int | None:
+    """a whole number, e.g. a menu selection"""
+    text = text.strip()
+    if not text:
+        return default
+    try:
+        return int(text)
+    except ValueError:
+        return None
+
+def parse_days(text: str, default: int | None = None) -> int | None:
+    """a positive number of days (intervals, snoozes)"""
+    value = parse_int(text, default)
+    return value if value is None or value > 0 else None
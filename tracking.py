@@ -9,20 +9,25 @@ INCOME_PER_PAYCHECK = 3293.93
 SAVINGS_TARGET = 1500
 DEBT_TARGET = 2500
 
+# allocations only depend on the config above, so work them out once
+_NEEDS = INCOME_PER_PAYCHECK * 0.47
+_SAVINGS = SAVINGS_TARGET / 2
+_WANTS = INCOME_PER_PAYCHECK - _NEEDS - _SAVINGS
+
+# everything below the dated header is fixed
+_ALLOCATION_BODY = (
+    f"Debt Attack: ${_NEEDS:.2f}\n"
+    f"Savings Seed: ${_SAVINGS:.2f}\n"
+    f"Life Money: ${_WANTS:.2f}\n"
+    + "-"*40 + "\n"
+    "ACTION: Transfer immediately to buckets!"
+)
+
 def main():
     today = datetime.date.today()
     
-    # Calculate monthly allocations
-    needs = INCOME_PER_PAYCHECK * 0.47
-    savings = SAVINGS_TARGET / 2
-    wants = INCOME_PER_PAYCHECK - needs - savings
-    
     print(f"\n=== PAYCHECK ALLOCATION ({today.strftime('%Y-%m-%d')} ===")
-    print(f"Debt Attack: ${needs:.2f}")
-    print(f"Savings Seed: ${savings:.2f}")
-    print(f"Life Money: ${wants:.2f}")
-    print("-"*40)
-    print("ACTION: Transfer immediately to buckets!")
+    print(_ALLOCATION_BODY)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()